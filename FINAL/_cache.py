@@ -0,0 +1,61 @@
+"""Small in-memory TTL cache for hot read queries.
+
+Entries expire after a short TTL so the UI never shows stale data for
+long, and mutators in services.py delete the affected keys eagerly so
+refreshes after an edit always see fresh rows.
+"""
+
+import functools
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class MemoryCache:
+    def __init__(self, default_ttl: float = 30.0, max_size: int = 128) -> None:
+        self._default_ttl = default_ttl
+        self._max_size = max_size
+        # key -> (expires_at, value); insertion order doubles as eviction order
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Tuple, value: Any, ttl: Optional[float] = None) -> None:
+        if key not in self._entries and len(self._entries) >= self._max_size:
+            # Evict the oldest entry to stay within bounds
+            self._entries.pop(next(iter(self._entries)))
+        expires_at = time.monotonic() + (self._default_ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+
+    def delete(self, name: str) -> None:
+        """Drop every cached result for the given function name."""
+        for key in [k for k in self._entries if k[0] == name]:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def cached(cache: MemoryCache, name: str) -> Callable:
+    """Memoize a positional-args-only query function in the given cache."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = (name,) + args
+            value = cache.get(key)
+            if value is None:
+                value = func(*args)
+                cache.set(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
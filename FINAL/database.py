@@ -1,10 +1,19 @@
 import os
 import sqlite3
+import threading
 from typing import Iterable, Tuple
 
 
 DB_FILENAME = "camptrack.db"
 
+# Bump whenever the DDL in init_db changes so existing databases re-run it
+SCHEMA_VERSION = "4"
+
+# One connection per thread (UI thread plus the worker pool); opening a
+# connection and re-running the PRAGMA setup per call is measurable on
+# refresh paths that issue several small SELECTs.
+_local = threading.local()
+
 
 def _project_root() -> str:
     return os.path.dirname(os.path.abspath(__file__))
@@ -15,9 +24,29 @@ def _db_path() -> str:
 
 
 def _connect() -> sqlite3.Connection:
-    conn = sqlite3.connect(_db_path())
+    """Return this thread's memoized connection, opening it on first use.
+
+    Callers keep using ``with _connect() as conn:`` for transaction
+    scoping; the handle itself is never closed.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
+    # cached_statements keeps prepared statements alive across the many
+    # small repeated SELECTs the dashboards issue.
+    conn = sqlite3.connect(_db_path(), cached_statements=256)
     # Enforce foreign keys
     conn.execute("PRAGMA foreign_keys = ON;")
+    # WAL lets UI reads proceed concurrently with writes; the remaining
+    # pragmas trade a little durability/temp-file I/O for query speed.
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -65536;")
+    # Memory-map the database file so reads hit the page cache without
+    # a read() syscall per page (256 MB cap; harmless if the OS trims it)
+    conn.execute("PRAGMA mmap_size = 268435456;")
+    _local.conn = conn
     return conn
 
 
@@ -26,23 +55,37 @@ def _executescript(conn: sqlite3.Connection, script: str) -> None:
 
 
 def _executemany(conn: sqlite3.Connection, sql: str, rows: Iterable[Tuple]) -> None:
-    conn.executemany(sql, list(rows))
+    # executemany streams from any iterable; materializing a list here
+    # doubled peak memory for large bulk imports
+    conn.executemany(sql, rows)
 
 
 def init_db() -> None:
     """Create tables and indexes if they do not exist."""
     os.makedirs(os.path.join(_project_root(), "data"), exist_ok=True)
-    
-    # Migration: Drop legacy unique indexes that are too strict
+
     conn = _connect()
+    # Skip the whole DDL pass when this schema version already ran:
+    # every CREATE ... IF NOT EXISTS still costs a parse and a catalog
+    # probe on each launch.
+    try:
+        row = conn.execute(
+            "SELECT value FROM settings WHERE key = 'schema_version';"
+        ).fetchone()
+        if row and row[0] == SCHEMA_VERSION:
+            return
+    except sqlite3.OperationalError:
+        pass  # Fresh database; settings table not created yet
+
+    # Migration: Drop legacy unique indexes that are too strict
     try:
         conn.execute("DROP INDEX IF EXISTS unique_daily_report;")
         conn.execute("DROP INDEX IF EXISTS one_coordinator;")
         conn.commit()
     except Exception:
         pass  # Index might not exist
-    conn.close()
-    
+
+
     with _connect() as conn:
         _executescript(
             conn,
@@ -176,8 +219,33 @@ def init_db() -> None:
                 feedback  TEXT NOT NULL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
             );
+
+            -- Lookup indexes for the per-leader/per-camp SELECTs behind
+            -- the dashboards (statistics, detail tabs, chat ordering)
+            CREATE INDEX IF NOT EXISTS idx_la_leader ON leader_assignments(leader_user_id);
+            CREATE INDEX IF NOT EXISTS idx_cc_camp ON camp_campers(camp_id);
+            CREATE INDEX IF NOT EXISTS idx_act_camp ON activities(camp_id);
+            CREATE INDEX IF NOT EXISTS idx_dr_camp_leader ON daily_reports(camp_id, leader_user_id);
+            CREATE INDEX IF NOT EXISTS idx_msgs_created ON messages(created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_la_camp ON leader_assignments(camp_id);
+            CREATE INDEX IF NOT EXISTS idx_ca_act ON camper_activity(activity_id);
+            CREATE INDEX IF NOT EXISTS idx_st_camp ON stock_topups(camp_id);
+
+            -- Match the ORDER BY shape of the camper/camp list queries so
+            -- SQLite walks the index instead of sorting a temp b-tree
+            CREATE INDEX IF NOT EXISTS campers_name_ci ON campers(LOWER(last_name), LOWER(first_name));
+            CREATE INDEX IF NOT EXISTS camps_start_name ON camps(start_date, name);
+            -- Covering probe for "which camps is this camper in"; the
+            -- UNIQUE(camp_id, camper_id) autoindex has the wrong key order
+            CREATE INDEX IF NOT EXISTS idx_cc_camper ON camp_campers(camper_id, camp_id);
             """,
         )
+        # Refresh planner statistics so the new indexes are actually chosen
+        conn.execute("ANALYZE;")
+        conn.execute(
+            "INSERT OR REPLACE INTO settings(key, value) VALUES ('schema_version', ?);",
+            (SCHEMA_VERSION,),
+        )
 
 def seed_initial_data() -> None:
     """Seed baseline settings and users per Note 1.
@@ -202,13 +270,12 @@ def seed_initial_data() -> None:
             ("parent1", "parent"),  # Default parent - always present
         ]
 
-        for username, role in baseline_users:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO users(username, role, enabled, password)
-                VALUES (?, ?, 1, '')
-                """,
-                (username, role),
-            )
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO users(username, role, enabled, password)
+            VALUES (?, ?, 1, '')
+            """,
+            baseline_users,
+        )
 
 
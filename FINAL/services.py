@@ -1,31 +1,58 @@
 import csv
 import sqlite3
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 import re
 
 import numpy as np
 import pandas as pd
 
 from database import _connect
+from _cache import MemoryCache, cached
 
 
 def _dict_cursor(conn: sqlite3.Connection) -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     return conn
 
+
+# Short-lived cache for the hottest list queries; mutators below delete
+# the affected keys so edits are visible on the next refresh
+_query_cache = MemoryCache(default_ttl=30.0, max_size=128)
+
+# get_camp_summary_df feeds several read paths in one dashboard render;
+# its DataFrame is reused until a camp-related mutator bumps the version.
+_CAMPS_VERSION = 0
+_CAMP_SUMMARY_CACHE: Optional[Tuple[int, pd.DataFrame]] = None
+
+
+def _bump_camps_version() -> None:
+    """Invalidate the cached camp summary after a camp-related write."""
+    global _CAMPS_VERSION, _CAMP_SUMMARY_CACHE
+    _CAMPS_VERSION += 1
+    _CAMP_SUMMARY_CACHE = None
+
 # =========================
 # UK phone (+44) utilities
 # =========================
 _UK_FORMATTED_RE = re.compile(r"^\+44\s\d{4}\s\d{6}$")  # +44 XXXX XXXXXX (10 digits after +44, grouped 4+6)
 _UK_COMPACT_RE = re.compile(r"^\+44\d{10}$")  # +44XXXXXXXXXX (10 digits after +44)
+_NONDIGIT_RE = re.compile(r"\D")
+_SEPARATOR_RE = re.compile(r"[ \-]")
+_UK_44_RE = re.compile(r"44\d{10}")  # missing '+' prefix
+_UK_LOCAL_RE = re.compile(r"0\d{10}")  # local 0XXXXXXXXXX
+# Drops spaces and dashes in one C-level pass instead of chained replace()
+_STRIP_TABLE = str.maketrans("", "", " -")
 
 
+@lru_cache(maxsize=4096)
 def normalize_uk_phone_to_formatted(value: str) -> Optional[str]:
     """Normalize a UK phone to '+44 XXXX XXXXXX' or return None if invalid.
 
     Accepts either '+44XXXXXXXXXX' (compact, 10 digits) or '+44 XXXX XXXXXX' (formatted).
-    Any other shape returns None.
+    Any other shape returns None. Results are memoized: the validators run
+    on every keystroke-level form check and the same contact strings recur.
     """
     s = (value or "").strip()
     if not s:
@@ -33,29 +60,38 @@ def normalize_uk_phone_to_formatted(value: str) -> Optional[str]:
     if _UK_FORMATTED_RE.fullmatch(s):
         return s
     # Strip spaces/dashes for compact check
-    compact = s.replace(" ", "").replace("-", "")
+    compact = s.translate(_STRIP_TABLE)
     if _UK_COMPACT_RE.fullmatch(compact):
         digits = compact[3:]  # 10 digits
         return f"+44 {digits[:4]} {digits[4:]}"  # 4 + 6 grouping
     return None
 
 
+@lru_cache(maxsize=4096)
 def normalize_uk_phone_to_compact(value: str) -> Optional[str]:
     """Normalize a UK phone to '+44XXXXXXXXXX' (no spaces) or None if invalid."""
     s = (value or "").strip()
     if not s:
         return None
-    if _UK_COMPACT_RE.fullmatch(s.replace(" ", "").replace("-", "")):
-        return s.replace(" ", "").replace("-", "")
+    compact = s.translate(_STRIP_TABLE)
+    if _UK_COMPACT_RE.fullmatch(compact):
+        return compact
     if _UK_FORMATTED_RE.fullmatch(s):
         # Convert formatted to compact
-        return s.replace(" ", "")
+        return compact
     return None
 
 
 def is_valid_uk_phone(value: str) -> bool:
     """True if value is a valid UK number in '+44XXXXXXXXXX' or '+44 XXXX XXXXXX' form."""
-    return normalize_uk_phone_to_formatted(value) is not None
+    # Answer from the regexes directly rather than building the formatted
+    # string via normalize_uk_phone_to_formatted just to discard it
+    s = (value or "").strip()
+    if not s:
+        return False
+    if _UK_FORMATTED_RE.fullmatch(s):
+        return True
+    return _UK_COMPACT_RE.fullmatch(s.translate(_STRIP_TABLE)) is not None
 
 
 def normalize_all_camper_phones() -> Dict[str, int]:
@@ -70,47 +106,49 @@ def normalize_all_camper_phones() -> Dict[str, int]:
     Returns counters: {'updated': n, 'unchanged': n, 'invalid': n}
     """
     counters: Dict[str, int] = {"updated": 0, "unchanged": 0, "invalid": 0}
+    # One connection for both the SELECT and the UPDATE so the whole pass
+    # runs in a single transaction; the cleanup itself is vectorized with
+    # pandas string kernels instead of four regex calls per camper.
     with _dict_cursor(_connect()) as conn:
-        rows = conn.execute("SELECT id, emergency_contact FROM campers;").fetchall()
-    with _connect() as conn_w:
-        for r in rows:
-            camper_id = int(r["id"])
-            raw = (r["emergency_contact"] or "").strip()
-            if not raw:
-                counters["unchanged"] += 1
-                continue
-            # Clean variants
-            digits_only = re.sub(r"\D", "", raw)
-            compact = raw.replace(" ", "").replace("-", "")
-            candidate_compact = None
-            # +44XXXXXXXXXX (keep as-is compact)
-            if _UK_COMPACT_RE.fullmatch(compact):
-                candidate_compact = compact
-            # 44XXXXXXXXXX (missing '+')
-            elif re.fullmatch(r"44\d{10}", digits_only):
-                candidate_compact = "+" + digits_only
-            # 0XXXXXXXXXX local UK → +44XXXXXXXXXX
-            elif re.fullmatch(r"0\d{10}", digits_only):
-                candidate_compact = "+44" + digits_only[1:]
-            # Already formatted but wrong grouping or spaces
-            else:
-                # Attempt to extract +44 and exactly 10 digits after anywhere
-                m = re.search(r"\+?44\D*(\d)\D*(\d)\D*(\d)\D*(\d)\D*(\d)\D*(\d)\D*(\d)\D*(\d)\D*(\d)\D*(\d)", raw)
-                if m:
-                    ten = "".join(m.groups())
-                    candidate_compact = "+44" + ten
-            normalized = normalize_uk_phone_to_formatted(candidate_compact or raw)
-            if not normalized:
-                counters["invalid"] += 1
-                continue
-            if normalized != raw:
-                conn_w.execute(
+        df = pd.read_sql_query("SELECT id, emergency_contact FROM campers;", conn)
+        if df.empty:
+            return counters
+        raw = df["emergency_contact"].fillna("").str.strip()
+        nonempty = raw != ""
+        # Fast path: rows already in '+44 XXXX XXXXXX' form (all of them
+        # on a re-run) skip the cleanup kernels entirely
+        formatted = raw.str.fullmatch(_UK_FORMATTED_RE)
+        work = raw[nonempty & ~formatted]
+        if not work.empty:
+            digits = work.str.replace(_NONDIGIT_RE, "", regex=True)
+            compact = work.str.replace(_SEPARATOR_RE, "", regex=True)
+            # The three accepted shapes, each reduced to the trailing 10 digits
+            mask_compact = compact.str.fullmatch(_UK_COMPACT_RE)  # +44XXXXXXXXXX
+            mask_44 = digits.str.fullmatch(_UK_44_RE)
+            mask_local = digits.str.fullmatch(_UK_LOCAL_RE)
+            ten = pd.Series(
+                np.select(
+                    [mask_compact, mask_44, mask_local],
+                    [compact.str[-10:], digits.str[-10:], digits.str[1:]],
+                    default="",
+                ),
+                index=work.index,
+            )
+            normalized = "+44 " + ten.str[:4] + " " + ten.str[4:]  # 4 + 6 grouping
+            valid = mask_compact | mask_44 | mask_local
+            changed = valid & (normalized != work)
+            counters["updated"] = int(changed.sum())
+            counters["invalid"] = int((~valid).sum())
+            if counters["updated"]:
+                # changed is indexed by work.index (a subset of df.index),
+                # so map it back through positions rather than boolean-
+                # indexing the full frame
+                changed_idx = work.index[changed]
+                conn.executemany(
                     "UPDATE campers SET emergency_contact = ? WHERE id = ?;",
-                    (normalized, camper_id),
+                    list(zip(normalized[changed], df["id"].loc[changed_idx].tolist())),
                 )
-                counters["updated"] += 1
-            else:
-                counters["unchanged"] += 1
+        counters["unchanged"] = len(df) - counters["updated"] - counters["invalid"]
     return counters
 
 
@@ -151,14 +189,25 @@ def get_user_by_username(username: str) -> Optional[Dict[str, Any]]:
         return dict(row) if row else None
 
 
-def list_users() -> List[Dict[str, Any]]:
+@cached(_query_cache, "list_users")
+def list_users(limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+    """List users, optionally one page at a time; see count_users for the total."""
+    query = "SELECT id, username, role, enabled FROM users ORDER BY role, username"
+    params: Tuple[Any, ...] = ()
+    if limit is not None:
+        query += " LIMIT ? OFFSET ?"
+        params = (limit, offset)
     with _dict_cursor(_connect()) as conn:
-        rows = conn.execute(
-            "SELECT id, username, role, enabled FROM users ORDER BY role, username;"
-        ).fetchall()
+        rows = conn.execute(query + ";", params).fetchall()
         return [dict(r) for r in rows]
 
 
+def count_users() -> int:
+    with _dict_cursor(_connect()) as conn:
+        row = conn.execute("SELECT COUNT(*) AS total FROM users;").fetchone()
+        return int(row["total"])
+
+
 def create_user(username: str, role: str) -> bool:
     try:
         with _connect() as conn:
@@ -166,6 +215,7 @@ def create_user(username: str, role: str) -> bool:
                 "INSERT INTO users(username, role, enabled, password) VALUES (?, ?, 1, '');",
                 (username.strip(), role),
             )
+        _query_cache.delete("list_users")
         return True
     except sqlite3.IntegrityError:
         return False
@@ -177,6 +227,7 @@ def update_user_enabled(user_id: int, enabled: bool) -> None:
             "UPDATE users SET enabled = ? WHERE id = ?;",
             (1 if enabled else 0, user_id),
         )
+    _query_cache.delete("list_users")
 
 
 def update_user_username(user_id: int, new_username: str) -> bool:
@@ -186,6 +237,7 @@ def update_user_username(user_id: int, new_username: str) -> bool:
                 "UPDATE users SET username = ? WHERE id = ?;",
                 (new_username.strip(), user_id),
             )
+        _query_cache.delete("list_users")
         return True
     except sqlite3.IntegrityError:
         return False
@@ -215,11 +267,48 @@ def delete_user(user_id: int) -> bool:
                     return False
         with _connect() as conn:
             conn.execute("DELETE FROM users WHERE id = ?;", (user_id,))
+        _query_cache.delete("list_users")
+        _query_cache.delete("list_parent_campers")
         return True
     except sqlite3.IntegrityError:
         return False
 
 
+def delete_users_bulk(user_ids: List[int]) -> int:
+    """Hard-delete several users in one transaction; returns rows deleted.
+
+    Role guards (sole leader/parent, admin, and so on) are the caller's
+    job — the admin UI applies them before confirming — so the batch is
+    one BEGIN/COMMIT instead of a round-trip per user. An integrity
+    failure rolls back the whole batch.
+    """
+    if not user_ids:
+        return 0
+    try:
+        with _connect() as conn:
+            cur = conn.executemany(
+                "DELETE FROM users WHERE id = ?;",
+                [(user_id,) for user_id in user_ids],
+            )
+            deleted = max(cur.rowcount, 0)
+        _query_cache.delete("list_users")
+        _query_cache.delete("list_parent_campers")
+        return deleted
+    except sqlite3.IntegrityError:
+        return 0
+
+
+def update_users_enabled_bulk(user_ids: List[int], enabled: bool) -> None:
+    if not user_ids:
+        return
+    with _connect() as conn:
+        conn.executemany(
+            "UPDATE users SET enabled = ? WHERE id = ?;",
+            [(1 if enabled else 0, user_id) for user_id in user_ids],
+        )
+    _query_cache.delete("list_users")
+
+
 def count_roles_total() -> Dict[str, int]:
     """Return total counts per role across all users (enabled and disabled)."""
     with _dict_cursor(_connect()) as conn:
@@ -279,9 +368,11 @@ def set_daily_pay_rate(value: str) -> None:
 # -------------------------
 # Messages
 # -------------------------
-def list_messages(limit: int = 100) -> List[Dict[str, Any]]:
+def list_messages(limit: int = 100) -> List[sqlite3.Row]:
+    # Rows are returned as sqlite3.Row: callers only read fields by name,
+    # so the per-row dict conversion was pure allocation overhead
     with _dict_cursor(_connect()) as conn:
-        rows = conn.execute(
+        return conn.execute(
             """
             SELECT m.id, m.content, m.created_at,
                    u.username AS sender_username, m.sender_user_id
@@ -292,7 +383,6 @@ def list_messages(limit: int = 100) -> List[Dict[str, Any]]:
             """,
             (limit,),
         ).fetchall()
-        return [dict(r) for r in rows]
 
 
 def post_message(sender_user_id: Optional[int], content: str) -> None:
@@ -312,6 +402,31 @@ def post_message(sender_user_id: Optional[int], content: str) -> None:
             conn.execute("PRAGMA foreign_keys = ON;")
 
 
+def post_messages_bulk(rows: List[Tuple[Optional[int], str]]) -> int:
+    """Insert many (sender_user_id, content) messages in one transaction.
+
+    Counterpart to post_message for batch producers; one executemany
+    instead of a commit per row. Returns the number of rows inserted.
+    """
+    cleaned = [
+        (sender_id, content.strip())
+        for sender_id, content in rows
+        if (content or "").strip()
+    ]
+    if not cleaned:
+        return 0
+    with _connect() as conn:
+        conn.execute("PRAGMA foreign_keys = OFF;")
+        try:
+            conn.executemany(
+                "INSERT INTO messages(sender_user_id, content) VALUES (?, ?);",
+                cleaned,
+            )
+        finally:
+            conn.execute("PRAGMA foreign_keys = ON;")
+    return len(cleaned)
+
+
 def clear_all_messages() -> int:
     """Delete all messages from chat. Returns count of deleted messages."""
     with _connect() as conn:
@@ -325,24 +440,101 @@ def clear_all_messages() -> int:
     return count
 
 
+def list_recent_messages_asc(limit: int = 100) -> List[sqlite3.Row]:
+    """Most recent `limit` messages in chronological order.
+
+    The inner DESC scan over the primary key picks the newest rows in
+    O(limit); the outer ORDER BY flips them so callers get display order
+    straight from the database instead of reversing in Python.
+    """
+    with _dict_cursor(_connect()) as conn:
+        return conn.execute(
+            """
+            SELECT * FROM (
+                SELECT m.id, m.content, m.created_at,
+                       u.username AS sender_username, m.sender_user_id
+                FROM messages m
+                LEFT JOIN users u ON u.id = m.sender_user_id
+                ORDER BY m.id DESC
+                LIMIT ?
+            ) ORDER BY id ASC;
+            """,
+            (limit,),
+        ).fetchall()
+
+
 def list_messages_lines(limit: int = 100) -> List[str]:
     lines = []
-    for row in list_messages(limit):
-        sender = row.get("sender_username") or "(system)"
+    for row in list_recent_messages_asc(limit):
+        sender = row["sender_username"] or "(system)"
         # Filter out system messages
         if sender == "(system)":
             continue
-        created = row.get("created_at") or ""
-        content = row.get("content") or ""
+        created = row["created_at"] or ""
+        content = row["content"] or ""
         lines.append(f"[{created}] {sender}: {content}")
-    return list(reversed(lines))
+    return lines
+
+
+def list_messages_lines_since(last_id: int, limit: int = 100) -> Tuple[List[str], int]:
+    """Return chat lines newer than last_id plus the newest id seen.
+
+    The first call (last_id == 0) matches list_messages_lines and returns
+    the most recent `limit` lines; later calls return only the delta, so
+    a chat refresh costs O(new messages) instead of O(history).
+    """
+    with _dict_cursor(_connect()) as conn:
+        if last_id:
+            rows = conn.execute(
+                """
+                SELECT m.id, m.content, m.created_at,
+                       u.username AS sender_username
+                FROM messages m
+                LEFT JOIN users u ON u.id = m.sender_user_id
+                WHERE m.id > ?
+                ORDER BY m.id
+                LIMIT ?
+                """,
+                (last_id, limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                """
+                SELECT * FROM (
+                    SELECT m.id, m.content, m.created_at,
+                           u.username AS sender_username
+                    FROM messages m
+                    LEFT JOIN users u ON u.id = m.sender_user_id
+                    ORDER BY m.id DESC
+                    LIMIT ?
+                ) ORDER BY id ASC;
+                """,
+                (limit,),
+            ).fetchall()
+    new_last_id = rows[-1]["id"] if rows else last_id
+    lines = []
+    for row in rows:
+        sender = row["sender_username"] or "(system)"
+        # Filter out system messages
+        if sender == "(system)":
+            continue
+        lines.append(f"[{row['created_at'] or ''}] {sender}: {row['content'] or ''}")
+    return lines, new_last_id
 
 
 # -------------------------
 # Camp Management
 # -------------------------
+def list_camps_df() -> pd.DataFrame:
+    """Camp summary as a DataFrame for callers that iterate or slice.
+
+    Skips the per-row dict conversion of list_camps; the frame comes
+    straight from the version-cached summary."""
+    return get_camp_summary_df()
+
+
 def list_camps() -> List[Dict[str, Any]]:
-    df = get_camp_summary_df()
+    df = list_camps_df()
     if df.empty:
         return []
     return df.to_dict("records")
@@ -384,6 +576,7 @@ def create_camp(
                     default_food_units_per_camper_per_day,
                 ),
             )
+        _bump_camps_version()
         return True
     except sqlite3.IntegrityError:
         return False
@@ -421,6 +614,7 @@ def update_camp(
                     camp_id,
                 ),
             )
+        _bump_camps_version()
         return True
     except sqlite3.IntegrityError:
         return False
@@ -435,6 +629,7 @@ def delete_camp(camp_id: int) -> bool:
                 conn.execute("DELETE FROM camps WHERE id = ?;", (camp_id,))
             finally:
                 conn.execute("PRAGMA foreign_keys = ON;")
+        _bump_camps_version()
         return True
     except sqlite3.IntegrityError:
         return False
@@ -443,6 +638,7 @@ def delete_camp(camp_id: int) -> bool:
 # -------------------------
 # Campers
 # -------------------------
+@cached(_query_cache, "list_campers")
 def list_campers() -> List[Dict[str, Any]]:
     """List all campers with core fields."""
     with _dict_cursor(_connect()) as conn:
@@ -485,6 +681,8 @@ def update_camper(camper_id: int, first_name: str, last_name: str, dob: str, eme
                 """,
                 (first_name.strip(), last_name.strip(), dob.strip(), emergency_contact.strip(), camper_id),
             )
+        _query_cache.delete("list_campers")
+        _query_cache.delete("list_parent_campers")
         return res.rowcount > 0
     except sqlite3.IntegrityError:
         return False
@@ -504,6 +702,9 @@ def delete_camper(camper_id: int) -> bool:
 
             # Delete the camper
             conn.execute("DELETE FROM campers WHERE id = ?;", (camper_id,))
+            _query_cache.delete("list_campers")
+            _query_cache.delete("list_parent_campers")
+            _bump_camps_version()
             return True
     except sqlite3.IntegrityError as e:
         print(f"Error deleting camper {camper_id}: {e}")
@@ -541,6 +742,7 @@ def update_camp_camper_food(camp_camper_id: int, food_units_per_day: int) -> Non
             "UPDATE camp_campers SET food_units_per_day = ? WHERE id = ?;",
             (food_units_per_day, camp_camper_id),
         )
+    _bump_camps_version()
 
 
 def import_campers_from_csv(camp_id: int, file_path: str) -> Dict[str, Any]:
@@ -578,88 +780,133 @@ def import_campers_from_csv(camp_id: int, file_path: str) -> Dict[str, Any]:
     skipped_overlap = 0
     errors: List[str] = []
 
-    def _find_camper(first_name: str, last_name: str, dob: str) -> Optional[int]:
-        with _dict_cursor(_connect()) as conn:
-            row = conn.execute(
+    default_food = int(camp.get("default_food_units_per_camper_per_day", 0) or 0)
+    target_start = pd.to_datetime(camp["start_date"], format='%Y-%m-%d')
+    target_end = pd.to_datetime(camp["end_date"], format='%Y-%m-%d')
+
+    # Validate in Python first so the database work below runs on clean rows
+    valid_rows: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+    for (first_name, last_name, dob), row in unique_rows.items():
+        if not first_name or not last_name or not dob:
+            errors.append(f"Invalid row missing data: {row}")
+            continue
+
+        # Validate names (letters and hyphens only)
+        if not validate_camper_name(first_name):
+            errors.append(f"Invalid first name '{first_name}' - only letters, hyphens, apostrophes, and spaces allowed")
+            continue
+        if not validate_camper_name(last_name):
+            errors.append(f"Invalid last name '{last_name}' - only letters, hyphens, apostrophes, and spaces allowed")
+            continue
+
+        valid_rows[(first_name, last_name, dob)] = row
+
+    with _connect() as conn:
+        # Take the write lock up front; the whole import (lookups, new
+        # campers, links) commits as one transaction
+        conn.execute("BEGIN IMMEDIATE;")
+
+        # Resolve every CSV identity in one join against the temp key
+        # table instead of one SELECT per row; the join seeks via the
+        # camper_identity unique index.
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS import_keys("
+            "first_name TEXT, last_name TEXT, dob TEXT);"
+        )
+        conn.execute("DELETE FROM import_keys;")
+        conn.executemany(
+            "INSERT INTO import_keys(first_name, last_name, dob) VALUES (?, ?, ?);",
+            list(valid_rows.keys()),
+        )
+
+        def _lookup_ids() -> Dict[Tuple[str, str, str], int]:
+            found = conn.execute(
                 """
-                SELECT id FROM campers
-                WHERE LOWER(first_name) = LOWER(?) AND LOWER(last_name) = LOWER(?) AND dob = ?
-                """,
-                (first_name, last_name, dob),
-            ).fetchone()
-            return row["id"] if row else None
-
-    def _check_overlapping_camps(camper_id: int, target_camp: Dict) -> Optional[str]:
-        """Check if camper is already assigned to a camp with overlapping dates.
-        
-        Returns the name of the overlapping camp, or None if no overlap.
-        """
-        target_start = pd.to_datetime(target_camp["start_date"], format='%Y-%m-%d')
-        target_end = pd.to_datetime(target_camp["end_date"], format='%Y-%m-%d')
-        
-        with _dict_cursor(_connect()) as conn:
-            rows = conn.execute(
+                SELECT t.first_name, t.last_name, t.dob, c.id
+                FROM import_keys t
+                JOIN campers c
+                  ON LOWER(c.first_name) = LOWER(t.first_name)
+                 AND LOWER(c.last_name) = LOWER(t.last_name)
+                 AND c.dob = t.dob;
                 """
-                SELECT c.start_date, c.end_date, c.name, c.location, c.area
+            ).fetchall()
+            return {(r[0], r[1], r[2]): int(r[3]) for r in found}
+
+        existing = _lookup_ids()
+
+        # Current camp assignments for all matched campers in one query,
+        # for the overlap check below
+        camps_by_camper: Dict[int, List[Tuple]] = {}
+        if existing:
+            ids = list(existing.values())
+            placeholders = ",".join("?" * len(ids))
+            for r in conn.execute(
+                f"""
+                SELECT cc.camper_id, c.start_date, c.end_date, c.name, c.location, c.area
                 FROM camp_campers cc
                 JOIN camps c ON c.id = cc.camp_id
-                WHERE cc.camper_id = ?
+                WHERE cc.camper_id IN ({placeholders});
                 """,
-                (camper_id,),
-            ).fetchall()
-        
-        for row in rows:
-            existing_start = pd.to_datetime(row["start_date"], format='%Y-%m-%d')
-            existing_end = pd.to_datetime(row["end_date"], format='%Y-%m-%d')
-            # Check for overlap: NOT (target_end < existing_start OR target_start > existing_end)
-            if not (target_end < existing_start or target_start > existing_end):
-                # Return camp info for error message
-                return f"{row['name']} ({row['location']}, {row['area']})"
-        return None
-
-    default_food = int(camp.get("default_food_units_per_camper_per_day", 0) or 0)
-
-    with _connect() as conn:
-        for (first_name, last_name, dob), row in unique_rows.items():
-            if not first_name or not last_name or not dob:
-                errors.append(f"Invalid row missing data: {row}")
-                continue
-            
-            # Validate names (letters and hyphens only)
-            if not validate_camper_name(first_name):
-                errors.append(f"Invalid first name '{first_name}' - only letters, hyphens, apostrophes, and spaces allowed")
-                continue
-            if not validate_camper_name(last_name):
-                errors.append(f"Invalid last name '{last_name}' - only letters, hyphens, apostrophes, and spaces allowed")
-                continue
-
-            camper_id = _find_camper(first_name, last_name, dob)
+                ids,
+            ).fetchall():
+                camps_by_camper.setdefault(int(r[0]), []).append(r[1:])
+
+        accepted_keys: List[Tuple[str, str, str]] = []
+        new_rows: List[Tuple[str, str, str, str]] = []
+        for key, row in valid_rows.items():
+            first_name, last_name, dob = key
+            camper_id = existing.get(key)
             if camper_id is None:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO campers(first_name, last_name, dob, emergency_contact)
-                    VALUES (?, ?, ?, ?);
-                    """,
-                    (first_name, last_name, dob, row["emergency_contact"].strip()),
-                )
-                camper_id = cursor.lastrowid
+                new_rows.append((first_name, last_name, dob, row["emergency_contact"].strip()))
                 created += 1
             else:
                 # Check for overlapping camp assignments
-                overlap_camp_name = _check_overlapping_camps(camper_id, camp)
+                overlap_camp_name = None
+                for start_date, end_date, name, location, area in camps_by_camper.get(camper_id, ()):
+                    existing_start = pd.to_datetime(start_date, format='%Y-%m-%d')
+                    existing_end = pd.to_datetime(end_date, format='%Y-%m-%d')
+                    # Overlap: NOT (target_end < existing_start OR target_start > existing_end)
+                    if not (target_end < existing_start or target_start > existing_end):
+                        overlap_camp_name = f"{name} ({location}, {area})"
+                        break
                 if overlap_camp_name:
                     skipped_overlap += 1
                     errors.append(f"Skipped {first_name} {last_name}: already assigned to {overlap_camp_name} at the same time")
                     continue
                 linked += 1
+            accepted_keys.append(key)
 
-            conn.execute(
+        if new_rows:
+            conn.executemany(
+                """
+                INSERT INTO campers(first_name, last_name, dob, emergency_contact)
+                VALUES (?, ?, ?, ?);
+                """,
+                new_rows,
+            )
+            # One more join resolves the ids of the campers just created
+            existing = _lookup_ids()
+
+        # Bulk-link all accepted campers in one statement
+        link_rows = [
+            (camp_id, existing[key], default_food)
+            for key in accepted_keys
+            if key in existing
+        ]
+        if link_rows:
+            conn.executemany(
                 """
                 INSERT OR IGNORE INTO camp_campers(camp_id, camper_id, food_units_per_day)
                 VALUES (?, ?, ?);
                 """,
-                (camp_id, camper_id, default_food),
+                link_rows,
             )
+        conn.execute("DELETE FROM import_keys;")
+
+    if created:
+        _query_cache.delete("list_campers")
+    if link_rows:
+        _bump_camps_version()
 
     preview_rows = list(unique_rows.values())[:10]
     return {
@@ -692,30 +939,32 @@ def list_leader_assignments(leader_user_id: int) -> List[Dict[str, Any]]:
 
 def list_available_camps_for_leader(leader_user_id: int) -> List[Dict[str, Any]]:
     assignments = list_leader_assignments(leader_user_id)
-    assigned_ranges = [(
-        pd.to_datetime(rec["start_date"], format='%Y-%m-%d'),
-        pd.to_datetime(rec["end_date"], format='%Y-%m-%d')
-    ) for rec in assignments]
 
     df = get_camp_summary_df()
     if df.empty:
         return []
 
-    available = []
-    for _, camp in df.iterrows():
-        if camp["id"] in {rec["camp_id"] for rec in assignments}:
-            continue
-        camp_start = pd.to_datetime(camp["start_date"], format='%Y-%m-%d')
-        camp_end = pd.to_datetime(camp["end_date"], format='%Y-%m-%d')
-        conflict = False
-        for start, end in assigned_ranges:
-            if not (camp_end < start or camp_start > end):
-                conflict = True
-                break
-        if not conflict:
-            available.append(camp.to_dict())
-
-    return available
+    # Vectorized interval overlap instead of the camps x assignments
+    # Python loop with repeated pd.to_datetime parses
+    available = ~df["id"].isin({rec["camp_id"] for rec in assignments}).to_numpy()
+    if assignments:
+        # cache=True memoizes unique strings, and camp/assignment dates
+        # repeat heavily across the two columns
+        camp_starts = pd.to_datetime(df["start_date"], format="%Y-%m-%d", cache=True).to_numpy()
+        camp_ends = pd.to_datetime(df["end_date"], format="%Y-%m-%d", cache=True).to_numpy()
+        a_starts = pd.to_datetime(
+            [rec["start_date"] for rec in assignments], format="%Y-%m-%d", cache=True
+        ).to_numpy()
+        a_ends = pd.to_datetime(
+            [rec["end_date"] for rec in assignments], format="%Y-%m-%d", cache=True
+        ).to_numpy()
+        conflict = (
+            (camp_ends[:, None] >= a_starts[None, :])
+            & (camp_starts[:, None] <= a_ends[None, :])
+        ).any(axis=1)
+        available &= ~conflict
+
+    return df.loc[available].to_dict("records")
 
 
 def assign_leader_to_camp(leader_user_id: int, camp_id: int) -> bool:
@@ -726,6 +975,7 @@ def assign_leader_to_camp(leader_user_id: int, camp_id: int) -> bool:
                 "INSERT OR IGNORE INTO leader_assignments(leader_user_id, camp_id) VALUES (?, ?);",
                 (leader_user_id, camp_id),
             )
+        _bump_camps_version()
         return True
     except Exception:
         return False
@@ -737,6 +987,8 @@ def remove_leader_assignment(assignment_id: int, leader_user_id: int) -> bool:
             "DELETE FROM leader_assignments WHERE id = ? AND leader_user_id = ?;",
             (assignment_id, leader_user_id),
         )
+    if res.rowcount > 0:
+        _bump_camps_version()
     return res.rowcount > 0
 
 
@@ -764,6 +1016,7 @@ def create_activity(camp_id: int, name: str, date: str) -> bool:
                 "INSERT INTO activities(camp_id, name, date) VALUES (?, ?, ?);",
                 (camp_id, name.strip(), date),
             )
+        _bump_camps_version()
         return True
     except sqlite3.IntegrityError:
         return False
@@ -775,6 +1028,8 @@ def delete_activity(activity_id: int, camp_id: int) -> bool:
             "DELETE FROM activities WHERE id = ? AND camp_id = ?;",
             (activity_id, camp_id),
         )
+    if res.rowcount > 0:
+        _bump_camps_version()
     return res.rowcount > 0
 
 
@@ -790,6 +1045,8 @@ def update_activity(activity_id: int, camp_id: int, name: str, date: str) -> boo
                 """,
                 (name.strip(), date, activity_id, camp_id),
             )
+        if res.rowcount > 0:
+            _bump_camps_version()
         return res.rowcount > 0
     except sqlite3.IntegrityError:
         return False
@@ -828,23 +1085,130 @@ def list_activity_campers(activity_id: int) -> List[Dict[str, Any]]:
         return [dict(r) for r in rows]
 
 
+def count_activity_campers(camp_id: int) -> Dict[int, int]:
+    """Participant counts for every activity in a camp, keyed by activity id."""
+    with _dict_cursor(_connect()) as conn:
+        rows = conn.execute(
+            """
+            SELECT ca.activity_id, COUNT(*) AS participants
+            FROM camper_activity ca
+            JOIN activities a ON a.id = ca.activity_id
+            WHERE a.camp_id = ?
+            GROUP BY ca.activity_id;
+            """,
+            (camp_id,),
+        ).fetchall()
+        return {int(r["activity_id"]): int(r["participants"]) for r in rows}
+
+
 # -------------------------
 # Daily Reports
 # -------------------------
-def list_daily_reports(leader_user_id: int, camp_id: int) -> List[Dict[str, Any]]:
+def list_daily_reports(leader_user_id: int, camp_id: int, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+    """Return one page of reports; use count_daily_reports for the total."""
     with _dict_cursor(_connect()) as conn:
         rows = conn.execute(
             """
             SELECT id, date, notes
             FROM daily_reports
             WHERE leader_user_id = ? AND camp_id = ?
-            ORDER BY date DESC;
+            ORDER BY date DESC
+            LIMIT ? OFFSET ?;
             """,
-            (leader_user_id, camp_id),
+            (leader_user_id, camp_id, limit, offset),
         ).fetchall()
         return [dict(r) for r in rows]
 
 
+def count_daily_reports(leader_user_id: int, camp_id: int) -> int:
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT COUNT(*) FROM daily_reports WHERE leader_user_id = ? AND camp_id = ?;",
+            (leader_user_id, camp_id),
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+
+def get_tab_snapshot(leader_user_id: int, camp_id: int, reports_limit: int = 50) -> Dict[str, Any]:
+    """One-connection snapshot of everything the leader detail tabs need.
+
+    Bundles the camp's campers, activities (with participant counts) and
+    the first page of daily reports so a tab refresh costs a single
+    connection instead of one per query.
+    """
+    with _dict_cursor(_connect()) as conn:
+        campers = [
+            dict(r)
+            for r in conn.execute(
+                """
+                SELECT
+                    cc.id,                       -- camp_campers row id (kept as 'id')
+                    cam.id AS camper_id,         -- underlying campers.id
+                    cc.food_units_per_day,
+                    cam.first_name,
+                    cam.last_name,
+                    cam.dob,
+                    cam.emergency_contact
+                FROM camp_campers cc
+                JOIN campers cam ON cam.id = cc.camper_id
+                WHERE cc.camp_id = ?
+                ORDER BY LOWER(cam.last_name), LOWER(cam.first_name);
+                """,
+                (camp_id,),
+            ).fetchall()
+        ]
+        activities = [
+            dict(r)
+            for r in conn.execute(
+                """
+                SELECT id, name, date
+                FROM activities
+                WHERE camp_id = ?
+                ORDER BY date, name;
+                """,
+                (camp_id,),
+            ).fetchall()
+        ]
+        activity_counts = {
+            int(r["activity_id"]): int(r["participants"])
+            for r in conn.execute(
+                """
+                SELECT ca.activity_id, COUNT(*) AS participants
+                FROM camper_activity ca
+                JOIN activities a ON a.id = ca.activity_id
+                WHERE a.camp_id = ?
+                GROUP BY ca.activity_id;
+                """,
+                (camp_id,),
+            ).fetchall()
+        }
+        total_row = conn.execute(
+            "SELECT COUNT(*) AS total FROM daily_reports WHERE leader_user_id = ? AND camp_id = ?;",
+            (leader_user_id, camp_id),
+        ).fetchone()
+        reports = [
+            dict(r)
+            for r in conn.execute(
+                """
+                SELECT id, date, notes
+                FROM daily_reports
+                WHERE leader_user_id = ? AND camp_id = ?
+                ORDER BY date DESC
+                LIMIT ?;
+                """,
+                (leader_user_id, camp_id, reports_limit),
+            ).fetchall()
+        ]
+    return {
+        "camp_id": camp_id,
+        "campers": campers,
+        "activities": activities,
+        "activity_counts": activity_counts,
+        "reports": reports,
+        "reports_total": int(total_row["total"]) if total_row else 0,
+    }
+
+
 def save_daily_report(leader_user_id: int, camp_id: int, date: str, notes: str) -> None:
     """Save a new daily report (allows multiple reports for same date/camp)."""
     with _connect() as conn:
@@ -887,15 +1251,47 @@ def add_stock_topup(camp_id: int, delta_daily_units: int) -> None:
             "INSERT INTO stock_topups(camp_id, delta_daily_units) VALUES (?, ?);",
             (camp_id, delta_daily_units),
         )
+    _bump_camps_version()
+
+
+def add_stock_topups_bulk(rows: List[Tuple[int, int]]) -> int:
+    """Insert many (camp_id, delta_daily_units) top-ups in one transaction.
+
+    Counterpart to add_stock_topup for batch producers; applies the same
+    per-row bounds check, then a single executemany. Returns the number
+    of rows inserted.
+    """
+    for _, delta in rows:
+        if delta < -100000 or delta > 100000:
+            raise ValueError("Delta must be between -100000 and 100000 units per day.")
+    if not rows:
+        return 0
+    with _connect() as conn:
+        conn.executemany(
+            "INSERT INTO stock_topups(camp_id, delta_daily_units) VALUES (?, ?);",
+            rows,
+        )
+    _bump_camps_version()
+    return len(rows)
 
 
-def list_stock_topups(camp_id: int) -> List[Dict[str, Any]]:
+def list_stock_topups(camp_id: int) -> List[sqlite3.Row]:
+    # sqlite3.Row rows read by name like dicts; no per-row conversion
     with _dict_cursor(_connect()) as conn:
-        rows = conn.execute(
+        return conn.execute(
             "SELECT id, created_at, delta_daily_units FROM stock_topups WHERE camp_id = ? ORDER BY id DESC;",
             (camp_id,),
         ).fetchall()
-        return [dict(r) for r in rows]
+
+
+def sum_stock_topups(camp_id: int) -> int:
+    """Total top-up delta for a camp as one SQL aggregate."""
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(delta_daily_units),0) FROM stock_topups WHERE camp_id = ?;",
+            (camp_id,),
+        ).fetchone()
+        return int(row[0])
 
 
 def effective_daily_stock_for_camp(camp_id: int) -> int:
@@ -908,17 +1304,36 @@ def effective_daily_stock_for_camp(camp_id: int) -> int:
         if base_row is None:
             return 0
         base = int(base_row["daily_food_units_planned"]) or 0
-        delta = conn.execute(
-            "SELECT COALESCE(SUM(delta_daily_units),0) AS s FROM stock_topups WHERE camp_id = ?;",
-            (camp_id,),
-        ).fetchone()["s"]
-        return base + int(delta or 0)
+        return base + sum_stock_topups(camp_id)
 
 
 # -------------------------
 # Analytics & Statistics
 # -------------------------
+def _sql_date_norm(col: str) -> str:
+    """SQL expression re-padding a stored date for julianday()/date().
+
+    Camp and activity dates are stored without zero padding in places
+    (e.g. 2025-1-1), which SQLite's date functions reject.
+    """
+    rest = f"substr({col}, 6)"
+    return (
+        f"printf('%04d-%02d-%02d', "
+        f"CAST(substr({col}, 1, 4) AS INTEGER), "
+        f"CAST(substr({rest}, 1, instr({rest}, '-') - 1) AS INTEGER), "
+        f"CAST(substr({rest}, instr({rest}, '-') + 1) AS INTEGER))"
+    )
+
+
 def get_camp_summary_df() -> pd.DataFrame:
+    # A single dashboard render calls this three or four times via
+    # list_camps, the coordinator stats, and the pay report; reuse the
+    # DataFrame until a mutator bumps _CAMPS_VERSION.
+    global _CAMP_SUMMARY_CACHE
+    cached_entry = _CAMP_SUMMARY_CACHE
+    if cached_entry is not None and cached_entry[0] == _CAMPS_VERSION:
+        return cached_entry[1].copy(deep=False)
+
     with _connect() as conn:
         df = pd.read_sql_query(
             """
@@ -984,7 +1399,7 @@ def get_camp_summary_df() -> pd.DataFrame:
         )
 
     if df.empty:
-        return pd.DataFrame(
+        df = pd.DataFrame(
             columns=[
                 "id",
                 "name",
@@ -1005,6 +1420,8 @@ def get_camp_summary_df() -> pd.DataFrame:
                 "food_gap",
             ]
         )
+        _CAMP_SUMMARY_CACHE = (_CAMPS_VERSION, df)
+        return df.copy(deep=False)
 
     df = df.infer_objects(copy=False)
     for col in ["campers_count", "campers_food_units", "activities_count", "leaders_count", "topup_delta"]:
@@ -1023,7 +1440,9 @@ def get_camp_summary_df() -> pd.DataFrame:
     df["food_gap"] = (df["effective_daily_food"] - df["required_daily_food"]).astype(int)
     df["area"] = df["area"].fillna("")
 
-    return df
+    _CAMP_SUMMARY_CACHE = (_CAMPS_VERSION, df)
+    # Shallow copy: callers may add columns without poisoning the cache
+    return df.copy(deep=False)
 
 
 def compute_day_by_day_food_usage(camp_id: int) -> List[Dict[str, Any]]:
@@ -1036,9 +1455,8 @@ def compute_day_by_day_food_usage(camp_id: int) -> List[Dict[str, Any]]:
 
     dates = pd.date_range(start, end, freq="D")
 
-    # Cache top-up sum once instead of querying per day
-    topup_sum = sum(row["delta_daily_units"] for row in list_stock_topups(camp_id))
-    planned_daily = int(camp["daily_food_units_planned"]) + int(topup_sum)
+    # SQL aggregate instead of fetching every top-up row to sum in Python
+    planned_daily = int(camp["daily_food_units_planned"]) + sum_stock_topups(camp_id)
 
     with _connect() as conn:
         campers_df = pd.read_sql_query(
@@ -1063,14 +1481,16 @@ def compute_day_by_day_food_usage(camp_id: int) -> List[Dict[str, Any]]:
             params=(camp_id,),
         )
 
+    # One grouped pass over the activity rows instead of re-filtering the
+    # DataFrame for every camp day; days without activities fall back to
+    # the whole-roster total.
+    day_sums = activity_df.groupby("date")["food_units_per_day"].sum().astype(int).to_dict()
+    campers_total = int(campers_df["food_units_per_day"].sum())
+
     records = []
     for date in dates:
         date_str = date.strftime("%Y-%m-%d")
-        day_activities = activity_df[activity_df["date"] == date_str]
-        if not day_activities.empty:
-            required = int(day_activities["food_units_per_day"].sum())
-        else:
-            required = int(campers_df["food_units_per_day"].sum())
+        required = day_sums.get(date_str, campers_total)
 
         records.append(
             {
@@ -1085,16 +1505,71 @@ def compute_day_by_day_food_usage(camp_id: int) -> List[Dict[str, Any]]:
 
 
 def get_food_shortage_alerts() -> List[Dict[str, Any]]:
-    alerts = []
-    for camp in list_camps():
-        per_day = compute_day_by_day_food_usage(camp["id"])
-        shortages = [day for day in per_day if day["gap"] < 0]
-        if shortages:
+    """Camps with at least one day where planned food falls short.
+
+    One recursive-CTE query expands every camp's date range and joins the
+    per-day activity totals, replacing the previous per-camp calls into
+    compute_day_by_day_food_usage (three queries per camp).
+    """
+    start_norm = _sql_date_norm("c.start_date")
+    end_norm = _sql_date_norm("c.end_date")
+    with _dict_cursor(_connect()) as conn:
+        rows = conn.execute(
+            f"""
+            WITH RECURSIVE camp_days(camp_id, name, start_day, day, end_day, planned) AS (
+                SELECT c.id, c.name, date({start_norm}), date({start_norm}), date({end_norm}),
+                       c.daily_food_units_planned + COALESCE(tp.s, 0)
+                FROM camps c
+                LEFT JOIN (
+                    SELECT camp_id, SUM(delta_daily_units) AS s
+                    FROM stock_topups GROUP BY camp_id
+                ) tp ON tp.camp_id = c.id
+                WHERE date({start_norm}) IS NOT NULL
+                  AND date({end_norm}) IS NOT NULL
+                  AND date({start_norm}) <= date({end_norm})
+                UNION ALL
+                SELECT camp_id, name, start_day, date(day, '+1 day'), end_day, planned
+                FROM camp_days WHERE day < end_day
+            ),
+            roster AS (
+                SELECT camp_id, COALESCE(SUM(food_units_per_day), 0) AS total
+                FROM camp_campers GROUP BY camp_id
+            ),
+            activity_day AS (
+                SELECT a.camp_id, date({_sql_date_norm('a.date')}) AS day,
+                       SUM(cc.food_units_per_day) AS total
+                FROM activities a
+                JOIN camper_activity ca ON ca.activity_id = a.id
+                JOIN camp_campers cc ON cc.camper_id = ca.camper_id AND cc.camp_id = a.camp_id
+                GROUP BY a.camp_id, day
+            )
+            SELECT d.camp_id, d.name, d.day AS date,
+                   COALESCE(ad.total, r.total, 0) AS required,
+                   d.planned
+            FROM camp_days d
+            LEFT JOIN roster r ON r.camp_id = d.camp_id
+            LEFT JOIN activity_day ad ON ad.camp_id = d.camp_id AND ad.day = d.day
+            WHERE d.planned - COALESCE(ad.total, r.total, 0) < 0
+            ORDER BY d.start_day, d.name, d.day;
+            """
+        ).fetchall()
+
+    alerts: List[Dict[str, Any]] = []
+    for r in rows:
+        shortage = {
+            "date": r["date"],
+            "required": int(r["required"]),
+            "planned": int(r["planned"]),
+            "gap": int(r["planned"]) - int(r["required"]),
+        }
+        if alerts and alerts[-1]["camp_id"] == r["camp_id"]:
+            alerts[-1]["shortages"].append(shortage)
+        else:
             alerts.append(
                 {
-                    "camp_id": camp["id"],
-                    "camp_name": camp["name"],
-                    "shortages": shortages,
+                    "camp_id": int(r["camp_id"]),
+                    "camp_name": r["name"],
+                    "shortages": [shortage],
                 }
             )
     return alerts
@@ -1119,8 +1594,8 @@ def compute_leader_pay_report() -> List[Dict[str, Any]]:
         return []
 
     # Parse dates using YYYY-MM-DD format
-    assignments["start_date"] = pd.to_datetime(assignments["start_date"], format='%Y-%m-%d', errors="coerce")
-    assignments["end_date"] = pd.to_datetime(assignments["end_date"], format='%Y-%m-%d', errors="coerce")
+    assignments["start_date"] = pd.to_datetime(assignments["start_date"], format='%Y-%m-%d', errors="coerce", cache=True)
+    assignments["end_date"] = pd.to_datetime(assignments["end_date"], format='%Y-%m-%d', errors="coerce", cache=True)
 
     # Drop any rows with invalid dates to avoid downstream crashes
     assignments = assignments.dropna(subset=["start_date", "end_date"])
@@ -1131,29 +1606,24 @@ def compute_leader_pay_report() -> List[Dict[str, Any]]:
 
     daily_rate = float(get_daily_pay_rate() or "0")
 
-    results = []
-    for leader_id, group in assignments.groupby("leader_user_id"):
-        per_camp = []
-        total = 0.0
-        for _, row in group.iterrows():
-            camp_record = df[df["id"] == row["camp_id"]].iloc[0]
-            # Always compute non-negative pay
-            pay = daily_rate * max(0, int(row["days"]))
-            total += pay
-            per_camp.append(
-                {
-                    "camp_id": int(row["camp_id"]),
-                    "camp_name": camp_record["name"],
-                    "days": max(0, int(row["days"])),
-                    "pay": pay,
-                }
-            )
+    # One merge + vectorized arithmetic instead of filtering the summary
+    # DataFrame once per assignment row
+    merged = assignments.merge(
+        df[["id", "name"]].rename(columns={"name": "camp_name"}),
+        left_on="camp_id",
+        right_on="id",
+    )
+    merged["camp_id"] = merged["camp_id"].astype(int)
+    merged["days"] = merged["days"].astype(int)
+    merged["pay"] = daily_rate * merged["days"]
 
+    results = []
+    for leader_id, group in merged.groupby("leader_user_id"):
         results.append(
             {
                 "leader_user_id": int(leader_id),
-                "total_pay": total,
-                "per_camp": per_camp,
+                "total_pay": float(group["pay"].sum()),
+                "per_camp": group[["camp_id", "camp_name", "days", "pay"]].to_dict("records"),
             }
         )
 
@@ -1169,101 +1639,154 @@ def get_leader_pay_summary(leader_user_id: int) -> Dict[str, Any]:
 
 
 def get_leader_statistics(leader_user_id: int) -> List[Dict[str, Any]]:
-    """Get participation, food usage, and report stats for all camps led by this leader."""
-    assignments = list_leader_assignments(leader_user_id)
+    """Get participation, food usage, and report stats for all camps led by this leader.
 
-    # Reuse the same camp summary data that the coordinator dashboard uses
-    # so that figures like "effective_daily_food" stay consistent across
-    # coordinator and leader views.
-    camp_summary_df = get_camp_summary_df()
-    camp_summary_by_id = (
-        {int(row["id"]): row for _, row in camp_summary_df.iterrows()}
-        if not camp_summary_df.empty
-        else {}
+    One query with grouped subqueries replaces the old per-camp calls into
+    list_camp_campers/list_camp_activities/list_activity_campers, which
+    amplified into one round-trip per activity per camp.
+    """
+    camp_days = (
+        f"COALESCE(CAST(julianday({_sql_date_norm('c.end_date')}) - "
+        f"julianday({_sql_date_norm('c.start_date')}) AS INTEGER) + 1, 0)"
     )
+    with _dict_cursor(_connect()) as conn:
+        rows = conn.execute(
+            f"""
+            SELECT
+                c.id AS camp_id,
+                c.name AS camp_name,
+                COALESCE(c.area, '') AS camp_area,
+                {camp_days} AS camp_days,
+                COALESCE(cc.n, 0) AS total_campers,
+                COALESCE(cc.food, 0) AS food_allocated_per_day,
+                COALESCE(act.n, 0) AS total_activities,
+                COALESCE(att.n, 0) AS campers_attending,
+                c.daily_food_units_planned + COALESCE(tp.s, 0) AS effective_daily_food,
+                COALESCE(dr.n, 0) AS incident_report_count
+            FROM leader_assignments la
+            JOIN camps c ON c.id = la.camp_id
+            LEFT JOIN (
+                SELECT camp_id, COUNT(*) AS n, SUM(food_units_per_day) AS food
+                FROM camp_campers GROUP BY camp_id
+            ) cc ON cc.camp_id = c.id
+            LEFT JOIN (
+                SELECT camp_id, COUNT(*) AS n
+                FROM activities GROUP BY camp_id
+            ) act ON act.camp_id = c.id
+            LEFT JOIN (
+                SELECT a.camp_id, COUNT(DISTINCT ca.camper_id) AS n
+                FROM camper_activity ca
+                JOIN activities a ON a.id = ca.activity_id
+                GROUP BY a.camp_id
+            ) att ON att.camp_id = c.id
+            LEFT JOIN (
+                SELECT camp_id, SUM(delta_daily_units) AS s
+                FROM stock_topups GROUP BY camp_id
+            ) tp ON tp.camp_id = c.id
+            LEFT JOIN (
+                SELECT camp_id, COUNT(*) AS n
+                FROM daily_reports
+                WHERE leader_user_id = ?
+                GROUP BY camp_id
+            ) dr ON dr.camp_id = c.id
+            WHERE la.leader_user_id = ?
+            ORDER BY c.start_date;
+            """,
+            (leader_user_id, leader_user_id),
+        ).fetchall()
 
     stats = []
-    for assignment in assignments:
-        camp_id = assignment["camp_id"]
-
-        # Get campers count
-        campers = list_camp_campers(camp_id)
-        total_campers = len(campers)
-
-        # Get activities and participation
-        activities = list_camp_activities(camp_id)
-        total_activities = len(activities)
-
-        # Count unique campers who attended at least one activity
-        attending_campers = set()
-        for activity in activities:
-            participants = list_activity_campers(activity["id"])
-            attending_campers.update(p["id"] for p in participants)
-
-        campers_attending = len(attending_campers)
-        participation_rate = (campers_attending / total_campers * 100) if total_campers > 0 else 0
-
-        # Calculate total food allocated (per day across all campers)
-        total_food_allocated = sum(c["food_units_per_day"] for c in campers)
-
-        # Get camp details for duration
-        camp = get_camp(camp_id)
-        if camp:
-            # Parse camp dates using YYYY-MM-DD format
-            start = pd.to_datetime(camp["start_date"], format="%Y-%m-%d", errors="coerce")
-            end = pd.to_datetime(camp["end_date"], format="%Y-%m-%d", errors="coerce")
-
-            if pd.isna(start) or pd.isna(end):
-                camp_days = 0
-                total_food_used = 0
-            else:
-                camp_days = (end - start).days + 1
-                total_food_used = total_food_allocated * camp_days
-        else:
-            camp_days = 0
-            total_food_used = 0
-
-        # Pull the same "effective_daily_food" figure used in coordinator
-        # analytics so the leader Statistics tab matches exactly.
-        camp_summary = camp_summary_by_id.get(int(camp_id)) if camp_summary_by_id else None
-        # 'camp_summary' is a pandas Series; avoid using it directly in a
-        # boolean context (which is ambiguous). Instead, check explicitly
-        # for None, then pull the scalar value.
-        if camp_summary is not None and "effective_daily_food" in camp_summary:
-            try:
-                effective_daily = int(camp_summary["effective_daily_food"])
-            except Exception:
-                effective_daily = 0
-        else:
-            effective_daily = 0
-
-        # Count daily reports (incident reports)
-        reports = list_daily_reports(leader_user_id, camp_id)
-        incident_report_count = len(reports)
-
+    for row in rows:
+        total_campers = int(row["total_campers"])
+        campers_attending = int(row["campers_attending"])
+        days = int(row["camp_days"])
+        food_per_day = int(row["food_allocated_per_day"])
+        participation_rate = (
+            campers_attending / total_campers * 100 if total_campers > 0 else 0
+        )
         stats.append({
-            "camp_id": camp_id,
-            "camp_name": assignment["name"],
-            "camp_area": assignment.get("area", ""),
-            "camp_days": camp_days,
+            "camp_id": int(row["camp_id"]),
+            "camp_name": row["camp_name"],
+            "camp_area": row["camp_area"],
+            "camp_days": days,
             "total_campers": total_campers,
             "campers_attending": campers_attending,
             "participation_rate": round(participation_rate, 1),
-            "total_activities": total_activities,
-            "food_allocated_per_day": total_food_allocated,
-            "total_food_used": total_food_used,
-            "effective_daily_food": effective_daily,
-            "incident_report_count": incident_report_count,
+            "total_activities": int(row["total_activities"]),
+            "food_allocated_per_day": food_per_day,
+            "total_food_used": food_per_day * days,
+            "effective_daily_food": int(row["effective_daily_food"]),
+            "incident_report_count": int(row["incident_report_count"]),
         })
 
     return stats
 
 
+def get_leader_summary(leader_user_id: int) -> Dict[str, Any]:
+    """Cross-camp totals for the leader Statistics summary panel.
+
+    One SQL roll-up replaces fetching the full per-camp statistics and
+    summing them in Python; the per-camp figures come from grouped
+    subqueries so the totals match get_leader_statistics.
+    """
+    camp_days = (
+        f"COALESCE(CAST(julianday({_sql_date_norm('c.end_date')}) - "
+        f"julianday({_sql_date_norm('c.start_date')}) AS INTEGER) + 1, 0)"
+    )
+    with _dict_cursor(_connect()) as conn:
+        row = conn.execute(
+            f"""
+            SELECT
+                COUNT(*) AS total_camps,
+                COALESCE(SUM(cc.n), 0) AS total_campers,
+                COALESCE(SUM(act.n), 0) AS total_activities,
+                COALESCE(SUM(COALESCE(cc.food, 0) * {camp_days}), 0) AS total_food_used,
+                COALESCE(SUM(dr.n), 0) AS total_reports,
+                COALESCE(AVG(
+                    CASE WHEN COALESCE(cc.n, 0) > 0
+                         THEN COALESCE(att.n, 0) * 100.0 / cc.n
+                         ELSE 0 END
+                ), 0) AS avg_participation
+            FROM leader_assignments la
+            JOIN camps c ON c.id = la.camp_id
+            LEFT JOIN (
+                SELECT camp_id, COUNT(*) AS n, SUM(food_units_per_day) AS food
+                FROM camp_campers GROUP BY camp_id
+            ) cc ON cc.camp_id = c.id
+            LEFT JOIN (
+                SELECT camp_id, COUNT(*) AS n
+                FROM activities GROUP BY camp_id
+            ) act ON act.camp_id = c.id
+            LEFT JOIN (
+                SELECT a.camp_id, COUNT(DISTINCT ca.camper_id) AS n
+                FROM camper_activity ca
+                JOIN activities a ON a.id = ca.activity_id
+                GROUP BY a.camp_id
+            ) att ON att.camp_id = c.id
+            LEFT JOIN (
+                SELECT camp_id, COUNT(*) AS n
+                FROM daily_reports
+                WHERE leader_user_id = ?
+                GROUP BY camp_id
+            ) dr ON dr.camp_id = c.id
+            WHERE la.leader_user_id = ?;
+            """,
+            (leader_user_id, leader_user_id),
+        ).fetchone()
+    return {
+        "total_camps": int(row["total_camps"]),
+        "total_campers": int(row["total_campers"]),
+        "total_activities": int(row["total_activities"]),
+        "total_food_used": int(row["total_food_used"]),
+        "total_reports": int(row["total_reports"]),
+        "avg_participation": float(row["avg_participation"]),
+    }
+
+
 def get_coordinator_dashboard_stats() -> Dict[str, Any]:
     df = get_camp_summary_df()
     if df.empty:
         return {
-            "summary_records": [],
             "campers_per_camp": [],
             "leaders_per_camp": [],
             "activities_per_camp": [],
@@ -1271,8 +1794,6 @@ def get_coordinator_dashboard_stats() -> Dict[str, Any]:
             "food_comparison": [],
         }
 
-    summary_records = df.to_dict("records")
-
     campers_per_camp = list(
         zip(df["name"], df["campers_count"].astype(int))
     )
@@ -1292,17 +1813,15 @@ def get_coordinator_dashboard_stats() -> Dict[str, Any]:
     )
     camps_by_area = list(area_counts.items())
 
+    # Column-wise zip instead of materializing every row as a dict first
     food_comparison = [
-        {
-            "label": row["name"],
-            "effective": int(row["effective_daily_food"]),
-            "required": int(row["required_daily_food"]),
-        }
-        for row in summary_records
+        {"label": name, "effective": int(effective), "required": int(required)}
+        for name, effective, required in zip(
+            df["name"], df["effective_daily_food"], df["required_daily_food"]
+        )
     ]
 
     return {
-        "summary_records": summary_records,
         "campers_per_camp": campers_per_camp,
         "leaders_per_camp": leaders_per_camp,
         "activities_per_camp": activities_per_camp,
@@ -1340,6 +1859,7 @@ def add_parent_camper(parent_id: int, camper_id: int) -> bool:
                 "INSERT OR IGNORE INTO parent_campers(parent_id, camper_id) VALUES (?, ?);",
                 (parent_id, camper_id),
             )
+        _query_cache.delete("list_parent_campers")
         return True
     except sqlite3.IntegrityError:
         return False
@@ -1353,6 +1873,7 @@ def remove_parent_camper(parent_id: int, camper_id: int) -> bool:
                 "DELETE FROM parent_campers WHERE parent_id = ? AND camper_id = ?;",
                 (parent_id, camper_id),
             )
+        _query_cache.delete("list_parent_campers")
         return True
     except sqlite3.IntegrityError:
         return False
@@ -1374,6 +1895,7 @@ def get_camper_parent(camper_id: int) -> Optional[Dict[str, Any]]:
         return dict(row) if row else None
 
 
+@cached(_query_cache, "list_parent_campers")
 def list_parent_campers(parent_id: int) -> List[Dict[str, Any]]:
     """Return campers linked to the given parent user."""
     with _dict_cursor(_connect()) as conn:
@@ -1408,14 +1930,20 @@ def list_camps_for_camper(camper_id: int) -> List[Dict[str, Any]]:
 
 def list_camps_for_parent(parent_id: int) -> List[Dict[str, Any]]:
     """List unique camps associated with any camper linked to a parent."""
+    # EXISTS probes per camp instead of DISTINCT over the three-way join
+    # product; the outer scan walks camps_start_name so the ORDER BY is
+    # free, and both inner lookups hit covering indexes.
     with _dict_cursor(_connect()) as conn:
         rows = conn.execute(
             """
-            SELECT DISTINCT c.id, c.name, c.location, c.start_date, c.end_date, c.type
-            FROM parent_campers pc
-            JOIN camp_campers cc ON cc.camper_id = pc.camper_id
-            JOIN camps c ON c.id = cc.camp_id
-            WHERE pc.parent_id = ?
+            SELECT c.id, c.name, c.location, c.start_date, c.end_date, c.type
+            FROM camps c
+            WHERE EXISTS (
+                SELECT 1
+                FROM parent_campers pc
+                JOIN camp_campers cc ON cc.camper_id = pc.camper_id
+                WHERE cc.camp_id = c.id AND pc.parent_id = ?
+            )
             ORDER BY c.start_date, c.name;
             """,
             (parent_id,),
@@ -1530,6 +2058,58 @@ def get_camper_parent_info(camper_id: int) -> Optional[Dict[str, Any]]:
         return dict(row) if row else None
 
 
+def list_parent_campers_bulk() -> Dict[int, List[Dict[str, Any]]]:
+    """Map camper_id -> linked parents, fetched in a single query.
+
+    Bulk companion to get_camper_parent_info for views that render many
+    campers at once.
+    """
+    with _dict_cursor(_connect()) as conn:
+        rows = conn.execute(
+            """
+            SELECT pc.camper_id, u.id, u.username
+            FROM parent_campers pc
+            JOIN users u ON u.id = pc.parent_id
+            ORDER BY pc.camper_id;
+            """
+        ).fetchall()
+    parents_by_camper: Dict[int, List[Dict[str, Any]]] = {}
+    for r in rows:
+        parents_by_camper.setdefault(r["camper_id"], []).append(
+            {"id": r["id"], "username": r["username"]}
+        )
+    return parents_by_camper
+
+
+def list_consent_forms_for_camp(camp_id: int) -> Set[Tuple[int, int]]:
+    """Return the (parent_id, camper_id) pairs with consent given for a camp.
+
+    Bulk companion to has_consent_for_camp: one query instead of one per
+    camper.
+    """
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT parent_id, camper_id FROM parent_consents WHERE camp_id = ? AND consent = 1;",
+            (camp_id,),
+        ).fetchall()
+    return {(int(r[0]), int(r[1])) for r in rows}
+
+
+def get_consent_map(camp_id: int) -> Dict[int, bool]:
+    """Map camper_id to whether any parent has consented for the camp."""
+    with _dict_cursor(_connect()) as conn:
+        rows = conn.execute(
+            """
+            SELECT camper_id, MAX(consent) AS consented
+            FROM parent_consents
+            WHERE camp_id = ?
+            GROUP BY camper_id;
+            """,
+            (camp_id,),
+        ).fetchall()
+        return {int(r["camper_id"]): bool(r["consented"]) for r in rows}
+
+
 def is_camper_over_18(dob_str: str) -> bool:
     """Check if a camper is 18 or older based on DOB string (YYYY-MM-DD)."""
     import datetime as _dt
@@ -2,19 +2,22 @@
 
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from services import (
+    count_roles_enabled,
+    count_roles_total,
+    count_users,
     create_user,
     delete_user,
+    delete_users_bulk,
     list_messages_lines,
+    list_messages_lines_since,
     list_users,
     post_message,
     clear_all_messages,
-    update_user_enabled,
     update_user_username,
-    count_roles_total,
-    count_roles_enabled,
+    update_users_enabled_bulk,
     # Parent linking + data
     add_parent_camper,
     remove_parent_camper,
@@ -22,11 +25,22 @@ from services import (
     list_campers,
     get_camper_parent,
 )
-from ui.components import MessageBoard, ScrollFrame
-from ui.theme import get_palette, tint
+from itertools import cycle
+
+from ui.async_utils import run_async
+from ui.components import MessageBoard, ScrollFrame, apply_zebra_tags, bulk_insert_rows, tree_frozen
+
+# Zebra-stripe tag tuples shared by every insert loop
+_EVEN_TAG = ("even",)
+_ODD_TAG = ("odd",)
+
+def _build_parent_camper_tab(container: tk.Widget, users: Optional[List[Dict[str, Any]]] = None) -> None:
+    """Admin UI to link parent users to campers.
 
-def _build_parent_camper_tab(container: tk.Widget) -> None:
-    """Admin UI to link parent users to campers."""
+    `users` lets the caller share an already-fetched list_users() result
+    for the initial load; later reloads re-query so the options stay
+    fresh.
+    """
     import datetime as _dt
 
     def _is_adult(dob_str: str) -> bool:
@@ -56,22 +70,27 @@ def _build_parent_camper_tab(container: tk.Widget) -> None:
     parent_cb.grid(row=0, column=1, sticky="w")
     camper_cb = ttk.Combobox(selector_frame, textvariable=camper_var, values=(), state="readonly", width=30, exportselection=False)
     camper_cb.grid(row=0, column=3, sticky="w")
-    def _reload_options() -> None:
-        """Refresh parent and camper lists from DB."""
-        parents = [u for u in list_users() if u.get("role") == "parent" and u.get("enabled")]
+    def _reload_options(users: Optional[List[Dict[str, Any]]] = None) -> None:
+        """Refresh parent and camper lists from DB (or a shared users list)."""
+        all_users = users if users is not None else list_users()
+        parents = [u for u in all_users if u.get("role") == "parent" and u.get("enabled")]
         all_campers = list_campers()
         # Filter out campers who are 18 or older - only show under 18
         campers = [c for c in all_campers if not _is_adult(str(c.get("dob") or ""))]
-        # Build fresh labels
-        p_labels = [f"{p.get('username')}" for p in parents]
-        c_labels = [f"{c.get('first_name')} {c.get('last_name')}" for c in campers]
-        # Update mappings
+        # Build labels and mappings in one pass per list
+        parent_entries = [(f"{p.get('username')}", int(p["id"])) for p in parents]
+        camper_entries = [
+            (f"{c.get('first_name')} {c.get('last_name')}", int(c["id"]), str(c.get("dob") or ""))
+            for c in campers
+        ]
+        p_labels = [label for label, _pid in parent_entries]
+        c_labels = [label for label, _cid, _dob in camper_entries]
         parent_label_to_id.clear()
-        parent_label_to_id.update({label: int(p["id"]) for label, p in zip(p_labels, parents)})
+        parent_label_to_id.update(parent_entries)
         camper_label_to_id.clear()
-        camper_label_to_id.update({label: int(c["id"]) for label, c in zip(c_labels, campers)})
+        camper_label_to_id.update((label, cid) for label, cid, _dob in camper_entries)
         camper_id_to_dob.clear()
-        camper_id_to_dob.update({int(c["id"]): str(c.get("dob") or "") for c in campers})
+        camper_id_to_dob.update((cid, dob) for _label, cid, dob in camper_entries)
         # Preserve selection if still valid
         cur_parent = parent_var.get()
         cur_camper = camper_var.get()
@@ -82,7 +101,7 @@ def _build_parent_camper_tab(container: tk.Widget) -> None:
         if cur_camper not in camper_label_to_id:
             camper_var.set("" if c_labels else "")
     # Initial load and also reload on focus/click
-    _reload_options()
+    _reload_options(users)
     parent_cb.bind("<Button-1>", lambda _e: _reload_options())
     camper_cb.bind("<Button-1>", lambda _e: _reload_options())
     list_frame = ttk.Frame(container)
@@ -94,15 +113,20 @@ def _build_parent_camper_tab(container: tk.Widget) -> None:
     tree.column("camper", width=320, anchor=tk.W)
     tree.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
     def _refresh_links(*_args) -> None:
-        tree.delete(*tree.get_children())
         parent_label = parent_var.get()
         if not parent_label:
+            tree.delete(*tree.get_children())
             return
-        parent_id = parent_label_to_id[parent_label]
-        linked = list_parent_campers(parent_id)
-        for c in linked:
-            camper_name = f'{c["first_name"]} {c["last_name"]}'
-            tree.insert("", tk.END, values=(camper_name,))
+        run_async(tree, list_parent_campers, parent_label_to_id[parent_label], on_done=_populate_links)
+
+    def _populate_links(linked: List[Dict[str, Any]]) -> None:
+        # Precompute values, then insert with the tree hidden so the rows
+        # paint in a single redraw
+        values = [(f'{c["first_name"]} {c["last_name"]}',) for c in linked]
+        with tree_frozen(tree):
+            tree.delete(*tree.get_children())
+            for row in values:
+                tree.insert("", tk.END, values=row)
     def _link_parent_camper() -> None:
         parent_label = parent_var.get()
         camper_label = camper_var.get()
@@ -184,9 +208,23 @@ def _build_parent_camper_tab(container: tk.Widget) -> None:
     link_btn.grid(row=0, column=4, padx=(10, 0))
     unlink_btn = ttk.Button(selector_frame, text="Unlink Selected", command=_unlink_parent_camper)
     unlink_btn.grid(row=0, column=5, padx=(10, 0))
-    parent_cb.bind("<<ComboboxSelected>>", _refresh_links)
+
+    # Debounce selection events so keyboard-scrolling through parents
+    # coalesces into a single query instead of one per keystroke
+    _refresh_debounce_id: List[Optional[str]] = [None]
+
+    def _schedule_refresh(*_args) -> None:
+        if _refresh_debounce_id[0] is not None:
+            container.after_cancel(_refresh_debounce_id[0])
+        _refresh_debounce_id[0] = container.after(150, _refresh_links)
+
+    parent_cb.bind("<<ComboboxSelected>>", _schedule_refresh)
 
 def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callable[[], None]) -> tk.Frame:
+    # Loaded user rows by id; shared with the links tab so one fetch
+    # serves both on first open
+    user_cache: Dict[int, Dict[str, str]] = {}
+
     root_frame = ttk.Frame(root)
     # Use grid for proper resize behavior - ensures full-screen expansion
     root_frame.grid_rowconfigure(1, weight=1)  # Content row expands vertically
@@ -220,273 +258,360 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     tab_users.grid_rowconfigure(1, weight=1)  # Manage frame expands
     tab_users.grid_columnconfigure(0, weight=1)
 
-    ttk.Label(tab_users, text="User Accounts", font=("Helvetica", 12, "bold")).grid(row=0, column=0, sticky="w", padx=10, pady=(10, 2))
-    manage_frame = ttk.Frame(tab_users, style="Card.TFrame", padding=10)
-    manage_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
-
-    # Username search (exact, case-insensitive)
-    search_row = ttk.Frame(manage_frame)
-    search_row.pack(fill=tk.X, pady=(0, 6))
-    ttk.Label(search_row, text="Search username", style="Muted.TLabel").pack(side=tk.LEFT, padx=(0, 6))
-    search_var = tk.StringVar(value="")
-    search_entry = ttk.Entry(search_row, textvariable=search_var, width=20)
-    search_entry.pack(side=tk.LEFT, padx=4)
-    def do_search() -> None:
-        keyword = search_var.get().strip()
-        if not keyword:
-            # Clear selection if empty
-            sel = table.selection()
-            if sel:
-                table.selection_remove(*sel)
-            return
-        target = None
-        for item_id in table.get_children():
-            row_vals = table.item(item_id).get("values", [])
-            if not row_vals:
-                continue
-            username = str(row_vals[0])
-            if username.lower() == keyword.lower():
-                target = item_id
-                break
-        if target:
-            table.selection_set(target)
-            table.focus(target)
-            table.see(target)
-        else:
+    def _build_users_tab() -> None:
+        ttk.Label(tab_users, text="User Accounts", font=("Helvetica", 12, "bold")).grid(row=0, column=0, sticky="w", padx=10, pady=(10, 2))
+        manage_frame = ttk.Frame(tab_users, style="Card.TFrame", padding=10)
+        manage_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
+
+        # Username search (exact, case-insensitive)
+        search_row = ttk.Frame(manage_frame)
+        search_row.pack(fill=tk.X, pady=(0, 6))
+        ttk.Label(search_row, text="Search username", style="Muted.TLabel").pack(side=tk.LEFT, padx=(0, 6))
+        search_var = tk.StringVar(value="")
+        search_entry = ttk.Entry(search_row, textvariable=search_var, width=20)
+        search_entry.pack(side=tk.LEFT, padx=4)
+        def do_search() -> None:
+            keyword = search_var.get().strip()
+            if not keyword:
+                # Clear selection if empty
+                sel = table.selection()
+                if sel:
+                    table.selection_remove(*sel)
+                return
+            target = None
+            for item_id in table.get_children():
+                row_vals = table.item(item_id).get("values", [])
+                if not row_vals:
+                    continue
+                username = str(row_vals[0])
+                if username.lower() == keyword.lower():
+                    target = item_id
+                    break
+            if target:
+                table.selection_set(target)
+                table.focus(target)
+                table.see(target)
+            else:
+                sel = table.selection()
+                if sel:
+                    table.selection_remove(*sel)
+                messagebox.showinfo("Not found", "Not found")
+        def clear_search() -> None:
+            search_var.set("")
             sel = table.selection()
             if sel:
                 table.selection_remove(*sel)
-            messagebox.showinfo("Not found", "Not found")
-    def clear_search() -> None:
-        search_var.set("")
-        sel = table.selection()
-        if sel:
-            table.selection_remove(*sel)
-    ttk.Button(search_row, text="Search", command=do_search).pack(side=tk.LEFT, padx=4)
-    ttk.Button(search_row, text="Clear", command=clear_search).pack(side=tk.LEFT)
-
-    # Users table - no individual scrollbars, page-level scrolling only
-    table = ttk.Treeview(manage_frame, columns=("Username", "Role", "Enabled"), show="headings")
-    table.pack(fill=tk.BOTH, expand=True)
-    table.heading("Username", text="Username", anchor=tk.W)
-    table.heading("Role", text="Role", anchor=tk.CENTER)
-    table.heading("Enabled", text="Enabled", anchor=tk.CENTER)
-    # Columns stretch to fill available space
-    table.column("Username", width=220, minwidth=180, stretch=True, anchor=tk.W)
-    table.column("Role", width=160, minwidth=130, stretch=True, anchor=tk.CENTER)
-    table.column("Enabled", width=120, minwidth=100, stretch=True, anchor=tk.CENTER)
-
-    # Empty state label (hidden unless no users)
-    empty_label = ttk.Label(manage_frame, text="No users to display.", style="Muted.TLabel")
-    empty_label.pack_forget()
+        ttk.Button(search_row, text="Search", command=do_search).pack(side=tk.LEFT, padx=4)
+        ttk.Button(search_row, text="Clear", command=clear_search).pack(side=tk.LEFT)
+
+        # Users table - no individual scrollbars, page-level scrolling only;
+        # extended selection so enable/disable/delete can act on batches
+        table = ttk.Treeview(
+            manage_frame,
+            columns=("Username", "Role", "Enabled"),
+            show="headings",
+            selectmode="extended",
+        )
+        table.pack(fill=tk.BOTH, expand=True)
+        table.heading("Username", text="Username", anchor=tk.W)
+        table.heading("Role", text="Role", anchor=tk.CENTER)
+        table.heading("Enabled", text="Enabled", anchor=tk.CENTER)
+        # Columns stretch to fill available space
+        table.column("Username", width=220, minwidth=180, stretch=True, anchor=tk.W)
+        table.column("Role", width=160, minwidth=130, stretch=True, anchor=tk.CENTER)
+        table.column("Enabled", width=120, minwidth=100, stretch=True, anchor=tk.CENTER)
+
+        # Empty state label (hidden unless no users)
+        empty_label = ttk.Label(manage_frame, text="No users to display.", style="Muted.TLabel")
+        empty_label.pack_forget()
+
+        # Pagination footer: large deployments load 200 rows at a time
+        users_footer = ttk.Frame(manage_frame)
+        users_footer.pack(fill=tk.X)
+        users_count_label = ttk.Label(users_footer, text="", style="Muted.TLabel")
+        users_count_label.pack(side=tk.LEFT, pady=(2, 0))
+
+        users_page_size = 200
+        users_loaded = 0
+        users_total = 0
+
+        def _update_users_footer() -> None:
+            users_count_label.configure(text=f"Showing {users_loaded} of {users_total}")
+            if users_loaded < users_total:
+                load_more_btn.pack(side=tk.RIGHT, pady=(2, 0))
+            else:
+                load_more_btn.pack_forget()
+
+        def _append_user_rows(users: List[Dict[str, Any]], start_idx: int) -> None:
+            tag_cycle = cycle((_EVEN_TAG, _ODD_TAG))
+            if start_idx % 2:
+                next(tag_cycle)
+            rows = []
+            for tags, row in zip(tag_cycle, users):
+                user_cache[row["id"]] = row
+                if not row["enabled"]:
+                    tags = tags + ("disabled",)
+                rows.append(
+                    (row["id"], (row["username"], row["role"], "Yes" if row["enabled"] else "No"), tags)
+                )
+            # One Tcl eval for the whole page instead of one call per row
+            bulk_insert_rows(table, rows)
+
+        def refresh_users() -> None:
+            nonlocal users_total
+            users_total = count_users()
+            run_async(table, list_users, users_page_size, 0, on_done=_populate_users)
+
+        def _populate_users(users: List[Dict[str, Any]]) -> None:
+            nonlocal users_loaded
+            user_cache.clear()
+            table.delete(*table.get_children())
+            if not users:
+                users_loaded = 0
+                empty_label.pack(pady=(4, 0), anchor=tk.W)
+                _update_users_footer()
+                return
+            empty_label.pack_forget()
+            _append_user_rows(users, 0)
+            users_loaded = len(users)
+            _update_users_footer()
 
-    user_cache: Dict[int, Dict[str, str]] = {}
+        def _load_more_users() -> None:
+            run_async(table, list_users, users_page_size, users_loaded, on_done=_append_next_page)
 
-    def refresh_users() -> None:
-        table.delete(*table.get_children())
-        user_cache.clear()
-        palette = get_palette(table)
-        # Zebra striping
-        table.tag_configure("even", background=palette["surface"])
-        table.tag_configure("odd", background=tint(palette["surface"], -0.03))
-        users = list_users()
-        if not users:
-            empty_label.pack(pady=(4, 0), anchor=tk.W)
-            return
-        else:
-            empty_label.pack_forget()
-        for idx, row in enumerate(users):
-            user_cache[row["id"]] = row
-            tags = []
-            if not row["enabled"]:
-                tags.append("disabled")
-            tags.append("odd" if (idx % 2 == 1) else "even")
-            table.insert(
-                "",
-                tk.END,
-                iid=row["id"],
-                values=(row["username"], row["role"], "Yes" if row["enabled"] else "No"),
-                tags=tuple(tags),
-            )
+        def _append_next_page(users: List[Dict[str, Any]]) -> None:
+            nonlocal users_loaded
+            _append_user_rows(users, users_loaded)
+            users_loaded += len(users)
+            _update_users_footer()
 
-    table.tag_configure("disabled", foreground="#888888")
-
-    refresh_users()
-
-    form_frame = ttk.Frame(manage_frame)
-    form_frame.pack(fill=tk.X, pady=6)
-
-    ttk.Label(form_frame, text="Username", font=("Helvetica", 11)).grid(row=0, column=0, padx=4, pady=2, sticky=tk.W)
-    username_entry = ttk.Entry(form_frame, width=20)
-    username_entry.grid(row=0, column=1, padx=4, pady=2)
-
-    ttk.Label(form_frame, text="Role", font=("Helvetica", 11)).grid(row=0, column=2, padx=4, pady=2, sticky=tk.W)
-    role_var = tk.StringVar(value="leader")
-    # Allow creating leaders, parents, and coordinators (admin is fixed)
-    role_menu = ttk.Combobox(
-        form_frame,
-        textvariable=role_var,
-        values=["leader", "parent", "coordinator"],
-        state="readonly",
-        width=15,
-        style="Filled.TCombobox",
-        exportselection=False,
-    )
-    role_menu.grid(row=0, column=3, padx=4, pady=2)
-    def _on_combo_selected(evt) -> None:
-        # Ensure no lingering text selection in readonly state
-        w = evt.widget
-        try:
-            w.selection_clear()
-        except Exception:
-            try:
-                w.selection_clear(0, "end")
-            except Exception:
-                pass
-        try:
-            w.selection_range(0, 0)
-        except Exception:
-            pass
-        try:
-            w.icursor("end")
-        except Exception:
-            pass
-        # Optionally shift focus away so macOS doesn't draw focus glow
-        try:
-            form_frame.focus_set()
-        except Exception:
-            pass
-    role_menu.bind("<<ComboboxSelected>>", _on_combo_selected)
-
-    def create_user_action() -> None:
-        username = username_entry.get().strip()
-        role = role_var.get()
-        if not username:
-            messagebox.showwarning("Validation", "Username is required.")
-            return
-        # Admin role is unique; multiple coordinators are allowed as long as at least one stays enabled
-        if role == "admin":
-            for existing in user_cache.values():
-                if existing["role"] == "admin" and existing["enabled"]:
-                    messagebox.showerror(
-                        "Create user",
-                        "Exactly one admin is allowed. Disable the existing admin account first if you must replace it.",
-                    )
-                    return
-        if not create_user(username, role):
-            messagebox.showerror("Create user", "Failed to create user. Ensure username is unique and role limits allow it.")
-            return
-        username_entry.delete(0, tk.END)
-        refresh_users()
+        load_more_btn = ttk.Button(users_footer, text=f"Load {users_page_size} more", command=_load_more_users)
 
-    ttk.Button(form_frame, text="Create User", command=create_user_action).grid(row=0, column=4, padx=4, pady=2)
+        apply_zebra_tags(table)
+        table.tag_configure("disabled", foreground="#888888")
 
-    selection_frame = ttk.Frame(manage_frame)
-    selection_frame.pack(fill=tk.X, pady=4)
+        refresh_users()
 
-    ttk.Label(selection_frame, text="Select a user row, then:", style="Muted.TLabel", font=("Helvetica", 10)).pack(side=tk.LEFT, padx=4)
+        form_frame = ttk.Frame(manage_frame)
+        form_frame.pack(fill=tk.X, pady=6)
+
+        ttk.Label(form_frame, text="Username", font=("Helvetica", 11)).grid(row=0, column=0, padx=4, pady=2, sticky=tk.W)
+        username_entry = ttk.Entry(form_frame, width=20)
+        username_entry.grid(row=0, column=1, padx=4, pady=2)
+
+        ttk.Label(form_frame, text="Role", font=("Helvetica", 11)).grid(row=0, column=2, padx=4, pady=2, sticky=tk.W)
+        role_var = tk.StringVar(value="leader")
+        # Allow creating leaders, parents, and coordinators (admin is fixed)
+        role_menu = ttk.Combobox(
+            form_frame,
+            textvariable=role_var,
+            values=["leader", "parent", "coordinator"],
+            state="readonly",
+            width=15,
+            style="Filled.TCombobox",
+            exportselection=False,
+        )
+        role_menu.grid(row=0, column=3, padx=4, pady=2)
+        def _on_combo_selected(evt) -> None:
+            # Ensure no lingering text selection in readonly state
+            w = evt.widget
+            try:
+                w.selection_clear()
+            except Exception:
+                try:
+                    w.selection_clear(0, "end")
+                except Exception:
+                    pass
+            try:
+                w.selection_range(0, 0)
+            except Exception:
+                pass
+            try:
+                w.icursor("end")
+            except Exception:
+                pass
+            # Optionally shift focus away so macOS doesn't draw focus glow
+            try:
+                form_frame.focus_set()
+            except Exception:
+                pass
+        role_menu.bind("<<ComboboxSelected>>", _on_combo_selected)
 
-    def get_selected_user_id() -> Optional[int]:
-        selection = table.selection()
-        if not selection:
-            messagebox.showinfo("Selection", "Click on a user row in the table to select it.")
-            return None
-        return int(selection[0])
-
-    def get_selected_user() -> Optional[Dict[str, str]]:
-        user_id = get_selected_user_id()
-        if user_id is None:
-            return None
-        record = user_cache.get(user_id)
-        if record is None:
-            messagebox.showwarning("Selection", "User no longer exists; refreshing list.")
+        def create_user_action() -> None:
+            username = username_entry.get().strip()
+            role = role_var.get()
+            if not username:
+                messagebox.showwarning("Validation", "Username is required.")
+                return
+            # Admin role is unique; multiple coordinators are allowed as long as at least one stays enabled
+            if role == "admin" and count_roles_enabled().get("admin", 0):
+                messagebox.showerror(
+                    "Create user",
+                    "Exactly one admin is allowed. Disable the existing admin account first if you must replace it.",
+                )
+                return
+            if not create_user(username, role):
+                messagebox.showerror("Create user", "Failed to create user. Ensure username is unique and role limits allow it.")
+                return
+            username_entry.delete(0, tk.END)
             refresh_users()
-            return None
-        return record
 
-    def edit_username() -> None:
-        record = get_selected_user()
-        if record is None:
-            return
-        new_username = simpledialog.askstring(
-            "Edit username",
-            f"Enter new username for {record['username']}:",
-            initialvalue=record["username"],
-            parent=container,
-        )
-        if not new_username or new_username.strip() == "":
-            return
-        if not update_user_username(record["id"], new_username.strip()):
-            messagebox.showerror("Edit", "Failed to update username. Ensure it's unique.")
-            return
-        refresh_users()
+        ttk.Button(form_frame, text="Create User", command=create_user_action).grid(row=0, column=4, padx=4, pady=2)
+
+        selection_frame = ttk.Frame(manage_frame)
+        selection_frame.pack(fill=tk.X, pady=4)
+
+        ttk.Label(selection_frame, text="Select a user row, then:", style="Muted.TLabel", font=("Helvetica", 10)).pack(side=tk.LEFT, padx=4)
+
+        def get_selected_user() -> Optional[Dict[str, str]]:
+            selection = table.selection()
+            if not selection:
+                messagebox.showinfo("Selection", "Click on a user row in the table to select it.")
+                return None
+            record = user_cache.get(int(selection[0]))
+            if record is None:
+                messagebox.showwarning("Selection", "User no longer exists; refreshing list.")
+                refresh_users()
+            return record
+
+        def get_selected_users() -> List[Dict[str, str]]:
+            selection = table.selection()
+            if not selection:
+                messagebox.showinfo("Selection", "Click on one or more user rows to select them.")
+                return []
+            records = [user_cache[int(iid)] for iid in selection if int(iid) in user_cache]
+            if len(records) != len(selection):
+                messagebox.showwarning("Selection", "Some users no longer exist; refreshing list.")
+                refresh_users()
+                return []
+            return records
+
+        def edit_username() -> None:
+            record = get_selected_user()
+            if record is None:
+                return
+            new_username = simpledialog.askstring(
+                "Edit username",
+                f"Enter new username for {record['username']}:",
+                initialvalue=record["username"],
+                parent=container,
+            )
+            if not new_username or new_username.strip() == "":
+                return
+            if not update_user_username(record["id"], new_username.strip()):
+                messagebox.showerror("Edit", "Failed to update username. Ensure it's unique.")
+                return
+            refresh_users()
 
-    def set_enabled(enabled: bool) -> None:
-        record = get_selected_user()
-        if record is None:
-            return
-        role = record.get("role", "")
-        username_display = record.get("username", "User")
-        # If the requested state equals current state, inform and return
-        if bool(record.get("enabled")) == bool(enabled):
+        def set_enabled(enabled: bool) -> None:
+            records = get_selected_users()
+            if not records:
+                return
             state_txt = "enabled" if enabled else "disabled"
-            messagebox.showinfo("Status unchanged", f"{username_display} is already {state_txt}.")
-            return
-        # Never allow disabling admin accounts
-        if role == "admin" and not enabled:
-            messagebox.showerror("Disable", "Cannot disable an admin account.")
-            return
-        # Prevent disabling the last enabled user of a role
-        if not enabled:
-            enabled_counts = count_roles_enabled()
-            if enabled_counts.get(role, 0) <= 1:
-                messagebox.showerror("Disable", f"Cannot disable the sole {role} account.")
+            # Whole-table enabled counts (the user list is paginated, so
+            # page-local tallies would be wrong past the first 200 rows);
+            # decremented as the batch is vetted so a multi-row disable
+            # cannot drain a role either
+            remaining_enabled = count_roles_enabled() if not enabled else {}
+            to_change: List[int] = []
+            for record in records:
+                role = record.get("role", "")
+                username_display = record.get("username", "User")
+                # Never allow disabling admin accounts (checked first so admin
+                # clicks skip the remaining guards entirely)
+                if role == "admin" and not enabled:
+                    messagebox.showerror("Disable", "Cannot disable an admin account.")
+                    return
+                # Rows already in the requested state are skipped silently in
+                # a batch; a single-row no-op still gets the usual notice
+                if bool(record.get("enabled")) == bool(enabled):
+                    if len(records) == 1:
+                        messagebox.showinfo("Status unchanged", f"{username_display} is already {state_txt}.")
+                        return
+                    continue
+                if not enabled and remaining_enabled.get(role, 0) <= 1:
+                    messagebox.showerror("Disable", f"Cannot disable the sole {role} account.")
+                    return
+                if record["id"] == user.get("id") and not enabled:
+                    messagebox.showwarning("Disable", "You cannot disable the account currently logged in.")
+                    return
+                if not enabled:
+                    remaining_enabled[role] = remaining_enabled.get(role, 0) - 1
+                to_change.append(record["id"])
+            if not to_change:
+                messagebox.showinfo("Status unchanged", f"All selected users are already {state_txt}.")
                 return
-        if record["id"] == user.get("id") and not enabled:
-            messagebox.showwarning("Disable", "You cannot disable the account currently logged in.")
-            return
-        update_user_enabled(record["id"], enabled)
-        refresh_users()
+            # One transaction for the whole batch
+            update_users_enabled_bulk(to_change, enabled)
+            # The row set didn't change, so patch just the affected rows
+            # in place instead of clearing and reinserting the table
+            for user_id in to_change:
+                record = user_cache[user_id]
+                record["enabled"] = 1 if enabled else 0
+                role = record.get("role", "")
+                iid = str(user_id)
+                stripe = next((t for t in table.item(iid, "tags") if t in ("even", "odd")), "even")
+                table.item(
+                    iid,
+                    values=(record["username"], role, "Yes" if enabled else "No"),
+                    tags=(stripe,) if enabled else (stripe, "disabled"),
+                )
 
-    def delete_selected() -> None:
-        record = get_selected_user()
-        if record is None:
-            return
-        role = record.get("role", "")
-        # Block deleting admin accounts entirely
-        if role == "admin":
-            messagebox.showerror("Delete", "Cannot delete the admin account.")
-            return
-        # Prevent deleting the last remaining user of a role (total users)
-        total_counts = count_roles_total()
-        if total_counts.get(role, 0) <= 1:
-            messagebox.showerror("Delete", f"Cannot delete the sole {role} account.")
-            return
-        # Additionally, never allow deleting the last *enabled* coordinator
-        # (must always have at least one enabled coordinator in the system)
-        if role == "coordinator" and record.get("enabled"):
-            enabled_counts = count_roles_enabled()
-            if enabled_counts.get("coordinator", 0) <= 1:
+        def delete_selected() -> None:
+            records = get_selected_users()
+            if not records:
+                return
+            # Vet the whole batch first, tracking how the deletions would
+            # change the tallies so a batch cannot wipe out a role either.
+            # Counts come from SQL aggregates: the paginated list only holds
+            # the loaded pages, so counting cached rows undercounts roles.
+            remaining_totals = count_roles_total()
+            remaining_enabled_coordinators = count_roles_enabled().get("coordinator", 0)
+            for record in records:
+                role = record.get("role", "")
+                # Block deleting admin accounts entirely
+                if role == "admin":
+                    messagebox.showerror("Delete", "Cannot delete the admin account.")
+                    return
+                # Prevent deleting the last remaining user of a role (total users)
+                if remaining_totals.get(role, 0) <= 1:
+                    messagebox.showerror("Delete", f"Cannot delete the sole {role} account.")
+                    return
+                # Additionally, never allow deleting the last *enabled* coordinator
+                # (must always have at least one enabled coordinator in the system)
+                if role == "coordinator" and record.get("enabled"):
+                    if remaining_enabled_coordinators <= 1:
+                        messagebox.showerror(
+                            "Delete",
+                            "Cannot delete the sole enabled coordinator account. "
+                            "Create and/or enable another coordinator first.",
+                        )
+                        return
+                    remaining_enabled_coordinators -= 1
+                if record["id"] == user.get("id"):
+                    messagebox.showwarning("Delete", "You cannot delete the account currently logged in.")
+                    return
+                remaining_totals[role] = remaining_totals.get(role, 0) - 1
+            prompt = (
+                "Are you sure? This is a hard delete."
+                if len(records) == 1
+                else f"Delete {len(records)} users? This is a hard delete."
+            )
+            if not messagebox.askyesno("Delete user", prompt):
+                return
+            # Single transaction for the batch instead of one commit per user
+            deleted = delete_users_bulk([record["id"] for record in records])
+            if deleted != len(records):
                 messagebox.showerror(
                     "Delete",
-                    "Cannot delete the sole enabled coordinator account. "
-                    "Create and/or enable another coordinator first.",
+                    "Cannot delete user(s) with existing assignments or logs. Disable instead.",
                 )
-                return
-        if record["id"] == user.get("id"):
-            messagebox.showwarning("Delete", "You cannot delete the account currently logged in.")
-            return
-        if not messagebox.askyesno("Delete user", "Are you sure? This is a hard delete."):
-            return
-        if not delete_user(record["id"]):
-            messagebox.showerror("Delete", "Cannot delete user with existing assignments or logs. Disable instead.")
-            return
-        refresh_users()
+            refresh_users()
 
-    ttk.Button(selection_frame, text="Edit name", command=edit_username).pack(side=tk.LEFT, padx=4)
-    ttk.Button(selection_frame, text="Enable", command=lambda: set_enabled(True)).pack(side=tk.LEFT, padx=4)
-    ttk.Button(selection_frame, text="Disable", command=lambda: set_enabled(False)).pack(side=tk.LEFT, padx=4)
-    ttk.Button(selection_frame, text="Delete", command=delete_selected).pack(side=tk.LEFT, padx=4)
+        ttk.Button(selection_frame, text="Edit name", command=edit_username).pack(side=tk.LEFT, padx=4)
+        ttk.Button(selection_frame, text="Enable", command=lambda: set_enabled(True)).pack(side=tk.LEFT, padx=4)
+        ttk.Button(selection_frame, text="Disable", command=lambda: set_enabled(False)).pack(side=tk.LEFT, padx=4)
+        ttk.Button(selection_frame, text="Delete", command=delete_selected).pack(side=tk.LEFT, padx=4)
 
     # ========== Tab 2: Parent–Camper Links ==========
     tab_links = tk.Frame(notebook)
@@ -494,7 +619,10 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     # Configure tab to expand properly
     tab_links.grid_rowconfigure(0, weight=1)  # Content expands
     tab_links.grid_columnconfigure(0, weight=1)
-    _build_parent_camper_tab(tab_links)
+
+    def _build_links_tab() -> None:
+        # Reuse the rows the users tab already fetched when available
+        _build_parent_camper_tab(tab_links, users=list(user_cache.values()) or None)
 
     # ========== Tab 3: Chat ==========
     tab_chat = tk.Frame(notebook)
@@ -503,16 +631,40 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     tab_chat.grid_rowconfigure(0, weight=1)  # Message board expands
     tab_chat.grid_columnconfigure(0, weight=1)
 
-    def post_message_wrapper(content: str) -> None:
-        post_message(user.get("id"), content)
+    def _build_chat_tab() -> None:
+        def post_message_wrapper(content: str) -> None:
+            post_message(user.get("id"), content)
+
+        MessageBoard(
+            tab_chat,
+            post_callback=post_message_wrapper,
+            fetch_callback=lambda: list_messages_lines(),
+            incremental_fetch=list_messages_lines_since,
+            current_user=user.get("username"),
+            clear_callback=clear_all_messages,
+        ).grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+    # Tabs are built lazily on first visit so opening the dashboard only
+    # pays for the tab actually being shown (queries included)
+    _tab_builders = {
+        "User Management": _build_users_tab,
+        "Parent–Camper Links": _build_links_tab,
+        "Chat": _build_chat_tab,
+    }
+    _tab_built: Dict[str, bool] = {name: False for name in _tab_builders}
+
+    def _ensure_tab_built(_evt=None) -> None:
+        try:
+            name = notebook.tab(notebook.select(), "text")
+        except Exception:
+            return
+        if name in _tab_builders and not _tab_built[name]:
+            _tab_built[name] = True
+            _tab_builders[name]()
 
-    MessageBoard(
-        tab_chat,
-        post_callback=post_message_wrapper,
-        fetch_callback=lambda: list_messages_lines(),
-        current_user=user.get("username"),
-        clear_callback=clear_all_messages,
-    ).grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+    notebook.bind("<<NotebookTabChanged>>", _ensure_tab_built, add="+")
+    # Build the initially selected tab right away
+    _ensure_tab_built()
 
     return root_frame
 
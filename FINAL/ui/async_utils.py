@@ -0,0 +1,29 @@
+"""Run blocking service calls off the Tk main thread.
+
+Tk widgets may only be touched from the thread that created them, so
+run_async executes the query on a small shared worker pool and marshals
+the result back through ``widget.after(0, ...)`` before invoking the
+callback. The callback therefore always runs on the main thread and can
+safely update widgets.
+"""
+
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="camptrack-db")
+
+
+def run_async(widget: tk.Misc, fn: Callable[..., Any], *args, on_done: Callable[[Any], None]) -> None:
+    """Call fn(*args) on a worker thread, then on_done(result) on the Tk thread."""
+    future = _EXECUTOR.submit(fn, *args)
+
+    def _deliver(f: Future) -> None:
+        result = f.result()
+        try:
+            widget.after(0, on_done, result)
+        except tk.TclError:
+            # Widget was destroyed (e.g. logout) before the query finished
+            pass
+
+    future.add_done_callback(_deliver)
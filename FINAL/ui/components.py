@@ -1,20 +1,128 @@
+import re
 import tkinter as tk
+from contextlib import contextmanager
+from itertools import cycle, repeat
 from tkinter import ttk, messagebox, filedialog
 from services import list_messages
 from typing import Callable, Iterable, List, Sequence, Tuple, Optional
 from ui.theme import get_palette, tint
 
+# Single-element tag tuples reused for every striped row
+_EVEN_TAG = ("even",)
+_ODD_TAG = ("odd",)
+
+
+@contextmanager
+def tree_frozen(tree: ttk.Treeview):
+    """Unmap a Treeview while rows are bulk-inserted.
+
+    A mapped Treeview schedules a redraw for every insert; hiding the
+    widget for the duration collapses that to one redraw when it comes
+    back. Restores the original pack/grid placement (including pack
+    order) on exit.
+    """
+    manager = tree.winfo_manager()
+    pack_opts = None
+    if manager == "pack":
+        pack_opts = tree.pack_info()
+        pack_opts.pop("in", None)
+        # Preserve position in the packing order
+        slaves = tree.master.pack_slaves()
+        idx = slaves.index(tree)
+        if idx + 1 < len(slaves):
+            pack_opts["before"] = slaves[idx + 1]
+        tree.pack_forget()
+    elif manager == "grid":
+        tree.grid_remove()
+    try:
+        yield tree
+    finally:
+        if manager == "pack" and pack_opts is not None:
+            tree.pack(**pack_opts)
+        elif manager == "grid":
+            tree.grid()
+
+
+# Characters Tcl treats specially; backslash-escaping them turns any
+# Python string into a single safe Tcl word. Whitespace control chars
+# need letter sequences (\n, \t, ...) rather than a literal backslash
+# before the char itself: Tcl substitutes backslash-newline as a space
+# and treats bare \r/\v/\f as word separators.
+_TCL_SPECIALS = re.compile(r'([\\{}\[\]$"; ])')
+_TCL_WS = {
+    ord("\n"): "\\n",
+    ord("\t"): "\\t",
+    ord("\r"): "\\r",
+    ord("\v"): "\\v",
+    ord("\f"): "\\f",
+}
+
+
+def _tcl_quote(value) -> str:
+    text = str(value)
+    if not text:
+        return "{}"
+    # Escape backslashes and separators first; the translate then maps
+    # whitespace to two-char sequences without re-escaping their backslash
+    return _TCL_SPECIALS.sub(r"\\\1", text).translate(_TCL_WS)
+
+
+def bulk_insert_rows(tree: ttk.Treeview, rows: Iterable[Tuple[object, Sequence[object], Sequence[str]]]) -> None:
+    """Insert (iid, values, tags) rows with a single Tcl eval.
+
+    Treeview.insert crosses the Python-to-Tcl boundary once per row,
+    which dominates large refreshes; joining the inserts into one script
+    collapses N interpreter round-trips into one. Every word is escaped
+    with _tcl_quote so arbitrary user text is safe to embed.
+    """
+    path = str(tree)
+    script = "\n".join(
+        "%s insert {} end -id %s -values [list %s] -tags [list %s]"
+        % (
+            path,
+            _tcl_quote(iid),
+            " ".join(_tcl_quote(v) for v in values),
+            " ".join(_tcl_quote(t) for t in tags),
+        )
+        for iid, values, tags in rows
+    )
+    if script:
+        tree.tk.eval(script)
+
+
+def apply_zebra_tags(tree: ttk.Treeview) -> None:
+    """Configure the even/odd stripe tags once, refreshing on theme change.
+
+    The palette only changes when the ttk theme does, so there is no need
+    to recompute the tint and reapply tag_configure on every refresh.
+    """
+
+    def _configure(_evt=None) -> None:
+        palette = get_palette(tree)
+        tree.tag_configure("even", background=palette["surface"])
+        tree.tag_configure("odd", background=tint(palette["surface"], -0.03))
+
+    _configure()
+    tree.bind("<<ThemeChanged>>", _configure, add="+")
+
 
 class MessageBoard(tk.Frame):
     def __init__(self, master: tk.Misc, post_callback: Callable[[str], None],
                  fetch_callback: Callable[[], Sequence[str]], current_user: Optional[str] = None,
-                 enable_search: bool = True, clear_callback: Optional[Callable[[], int]] = None):
+                 enable_search: bool = True, clear_callback: Optional[Callable[[], int]] = None,
+                 incremental_fetch: Optional[Callable[[int], Tuple[List[str], int]]] = None):
         super().__init__(master)
         self.post_callback = post_callback
         self.fetch_callback = fetch_callback
         self.current_user = current_user
         self.enable_search = enable_search
         self.clear_callback = clear_callback
+        self.incremental_fetch = incremental_fetch
+        # Highest message id already rendered; lets refresh append only
+        # the delta instead of rebuilding the whole history
+        self._last_id = 0
+        # Pending after() id used to coalesce rapid refresh triggers
+        self._pending: Optional[str] = None
 
         palette = get_palette(self)
         self.configure(background=palette["bg"])
@@ -66,7 +174,7 @@ class MessageBoard(tk.Frame):
         self.entry = ttk.Entry(entry_frame)
         self.entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        ttk.Button(entry_frame, text="Refresh", command=self.refresh).pack(side=tk.RIGHT)
+        ttk.Button(entry_frame, text="Refresh", command=self._schedule_refresh).pack(side=tk.RIGHT)
         ttk.Button(entry_frame, text="Send", command=self._send).pack(side=tk.RIGHT, padx=4)
         
         # Clear chat button (admin only)
@@ -75,12 +183,37 @@ class MessageBoard(tk.Frame):
                 if messagebox.askyesno("Clear Chat", "Are you sure you want to delete ALL messages? This cannot be undone."):
                     count = self.clear_callback()
                     messagebox.showinfo("Chat Cleared", f"Deleted {count} message(s).")
+                    # Ids may restart after a wipe, so drop the rendered
+                    # history and re-fetch from scratch
+                    self._last_id = 0
+                    for child in list(self.messages_frame.children.values()):
+                        child.destroy()
                     self.refresh()
             ttk.Button(entry_frame, text="Clear All", command=_clear_chat).pack(side=tk.RIGHT, padx=4)
 
         self.refresh()
 
+    def _schedule_refresh(self) -> None:
+        # Collapse a burst of refresh triggers (button mashing, future
+        # polling) into a single fetch ~30ms later.
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+        self._pending = self.after(30, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._pending = None
+        self.refresh()
+
     def refresh(self) -> None:
+        if self.incremental_fetch is not None:
+            lines, self._last_id = self.incremental_fetch(self._last_id)
+            if not lines:
+                return
+            for raw in lines:
+                created, sender, content = self._parse_line(raw)
+                self._add_bubble(sender, content, created)
+            self.after(10, lambda: self.canvas.yview_moveto(1.0))
+            return
         messages = list(self.fetch_callback())
         # Re-render as chat bubbles
         for child in list(self.messages_frame.children.values()):
@@ -154,9 +287,9 @@ class MessageBoard(tk.Frame):
                 return
 
         for row in rows:
-            sender = (row.get("sender_username") or "").strip()
-            created = str(row.get("created_at") or "").strip()
-            content = (row.get("content") or "").strip()
+            sender = (row["sender_username"] or "").strip()
+            created = str(row["created_at"] or "").strip()
+            content = (row["content"] or "").strip()
 
             if scope == "Users":
                 # Allow substring match on usernames (e.g., 'lea' matches 'leader1')
@@ -206,11 +339,11 @@ class MessageBoard(tk.Frame):
             if not path:
                 return
             try:
-                with open(path, "w", encoding="utf-8", newline="") as f:
-                    # Write plain lines; consumer can open in any editor
-                    for line in reversed(matches):
-                        f.write(line)
-                        f.write("\n")
+                # Serialize everything in memory first so the file is
+                # written with a single call instead of one per line.
+                payload = "".join(line + "\n" for line in reversed(matches))
+                with open(path, "wb") as f:
+                    f.write(payload.encode("utf-8"))
                 messagebox.showinfo("Export", f"Saved {len(matches)} line(s) to:\n{path}")
             except OSError as exc:
                 messagebox.showerror("Export failed", f"Could not write file:\n{exc}")
@@ -378,11 +511,150 @@ class Table(ttk.Treeview):
         for col in columns:
             self.heading(col, text=col)
             self.column(col, width=120)
+        # Stripe tags are configured once here; load_rows(striped=True)
+        # assigns them at insert time
+        apply_zebra_tags(self)
+
+    def load_rows(
+        self,
+        rows: List[Sequence[str]],
+        iids: Optional[Sequence[object]] = None,
+        striped: bool = False,
+    ) -> None:
+        """Replace the table contents; `iids` lets callers key rows by
+        their database id so a selection resolves without any scan, and
+        `striped` applies the even/odd zebra tags during the insert
+        instead of needing a second item() pass.
+
+        Existing rows are patched in place with item() where possible:
+        steady-state refreshes mostly change values, and one item() call
+        is cheaper than a delete plus an insert per row."""
+        tag_cycle = cycle((_EVEN_TAG, _ODD_TAG)) if striped else repeat(())
+        existing = self.get_children()
+        if iids is None:
+            reused = min(len(existing), len(rows))
+            # zip consumes the shared cycle, so appended rows continue
+            # with the right stripe parity
+            for item_id, tags, row in zip(existing, tag_cycle, rows):
+                self.item(item_id, values=row, tags=tags)
+            for tags, row in zip(tag_cycle, rows[reused:]):
+                self.insert("", tk.END, values=row, tags=tags)
+            if len(existing) > len(rows):
+                self.delete(*existing[len(rows):])
+        else:
+            new_iids = [str(iid) for iid in iids]
+            if list(existing) == new_iids:
+                for item_id, tags, row in zip(existing, tag_cycle, rows):
+                    self.item(item_id, values=row, tags=tags)
+            else:
+                # Row identity changed; rebuild so iids stay truthful
+                if existing:
+                    self.delete(*existing)
+                for tags, iid, row in zip(tag_cycle, new_iids, rows):
+                    self.insert("", tk.END, iid=iid, values=row, tags=tags)
+
+
+class VirtualTable(tk.Frame):
+    """Canvas-backed read-only table that only paints the visible rows.
+
+    ttk.Treeview materializes an item per row up front, so insertion cost
+    and memory grow with the dataset. This widget keeps the rows in a
+    plain list and renders at most one screen of them, re-painting the
+    window as the user scrolls. It is meant for large display-only lists;
+    interactive tables that need Treeview selection should keep Table.
+    """
+
+    ROW_HEIGHT = 24
+
+    def __init__(self, master: tk.Misc, columns: Iterable[str], visible_rows: int = 12):
+        super().__init__(master)
+        self._columns = list(columns)
+        self._data: List[Sequence[str]] = []
+        self._first_visible = 0
+        self._visible_rows = visible_rows
+
+        palette = get_palette(self)
+        self._row_colors = (palette["surface"], tint(palette["surface"], -0.03))
+
+        header = tk.Frame(self, background=tint(palette["surface"], -0.06))
+        header.pack(fill=tk.X)
+        for col in self._columns:
+            tk.Label(
+                header,
+                text=col,
+                anchor=tk.W,
+                background=tint(palette["surface"], -0.06),
+                font=("Helvetica", 10, "bold"),
+            ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=4, pady=2)
+
+        body = tk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(
+            body,
+            height=visible_rows * self.ROW_HEIGHT,
+            background=palette["surface"],
+            highlightthickness=0,
+        )
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._scrollbar = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self.yview)
+        self._scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas.bind("<MouseWheel>", lambda e: self.yview("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+        self.canvas.bind("<Configure>", lambda e: self._repaint())
 
     def load_rows(self, rows: List[Sequence[str]]) -> None:
-        self.delete(*self.get_children())
-        for row in rows:
-            self.insert("", tk.END, values=row)
+        self._data = list(rows)
+        self._first_visible = 0
+        self._repaint()
+
+    def yview(self, *args) -> None:
+        total = len(self._data)
+        if total <= self._visible_rows:
+            return
+        max_first = total - self._visible_rows
+        if args and args[0] == "moveto":
+            first = int(float(args[1]) * total)
+        elif args and args[0] == "scroll":
+            step = int(args[1]) * (self._visible_rows if args[2] == "pages" else 1)
+            first = self._first_visible + step
+        else:
+            return
+        first = max(0, min(first, max_first))
+        if first != self._first_visible:
+            self._first_visible = first
+            self._repaint()
+
+    def _repaint(self) -> None:
+        self.canvas.delete("rows")
+        total = len(self._data)
+        width = max(self.canvas.winfo_width(), 1)
+        col_width = width / max(len(self._columns), 1)
+        last = min(self._first_visible + self._visible_rows, total)
+        for slot, row in enumerate(self._data[self._first_visible:last]):
+            y = slot * self.ROW_HEIGHT
+            self.canvas.create_rectangle(
+                0,
+                y,
+                width,
+                y + self.ROW_HEIGHT,
+                fill=self._row_colors[(self._first_visible + slot) % 2],
+                outline="",
+                tags="rows",
+            )
+            for col_idx, value in enumerate(row):
+                self.canvas.create_text(
+                    col_idx * col_width + 6,
+                    y + self.ROW_HEIGHT // 2,
+                    text=str(value),
+                    anchor=tk.W,
+                    tags="rows",
+                )
+        if total:
+            self._scrollbar.set(self._first_visible / total, last / total)
+        else:
+            self._scrollbar.set(0.0, 1.0)
 
 
 class BarChart(tk.Canvas):
@@ -397,45 +669,84 @@ class BarChart(tk.Canvas):
         )
         self.width = width
         self.height = height
+        self._title_item: Optional[int] = None
+
+    # Layout constants shared by the chrome and the bar pass
+    _LR_MARGIN = 40
+    _TOP_MARGIN = 30
+    # Give a tall vertical band so full labels can stack downwards
+    _LABEL_BAND = 90
+    _BOTTOM_MARGIN = 10
+
+    def _ensure_chrome(self) -> None:
+        """Create the static chrome (title slot, axis, gridlines) once.
+
+        Their geometry depends only on the fixed canvas size, so redraws
+        just retext the title and rebuild the "bars" items instead of
+        recreating every canvas item."""
+        if self._title_item is not None:
+            return
+        self._title_item = self.create_text(
+            self.width // 2,
+            16,
+            text="",
+            font=("Helvetica", 11, "bold"),
+            fill="#2c3e50",
+        )
+        chart_height = self.height - self._TOP_MARGIN - self._LABEL_BAND - self._BOTTOM_MARGIN
+        x_axis_y = self._TOP_MARGIN + chart_height
+        # Axis baseline at bottom of chart area
+        self.create_line(
+            self._LR_MARGIN,
+            x_axis_y,
+            self.width - self._LR_MARGIN,
+            x_axis_y,
+            fill="#2c3e50",
+            width=2,
+            tags=("grid",),
+        )
+        # Horizontal gridlines inside chart area
+        for i in range(5):
+            y = x_axis_y - (i * chart_height / 4)
+            self.create_line(
+                self._LR_MARGIN,
+                y,
+                self.width - self._LR_MARGIN,
+                y,
+                fill="#ecf0f1",
+                width=1,
+                tags=("grid",),
+            )
 
     def draw(self, data: List[Tuple[str, int]], title: str = "") -> None:
         """Draw a simple bar chart with labels clearly below the bars."""
-        self.delete("all")
-
-        # Draw title
-        if title:
-            self.create_text(
-                self.width // 2,
-                16,
-                text=title,
-                font=("Helvetica", 11, "bold"),
-                fill="#2c3e50",
-            )
+        self._ensure_chrome()
+        # Static chrome persists across draws; only the bars rebuild
+        self.delete("bars")
+        self.itemconfigure(self._title_item, text=title)
 
         if not data:
+            self.itemconfigure("grid", state="hidden")
             self.create_text(
                 self.width // 2,
                 self.height // 2,
                 text="No data",
                 fill="#95a5a6",
                 font=("Helvetica", 10),
+                tags=("bars",),
             )
             return
+        self.itemconfigure("grid", state="normal")
 
         labels, values = zip(*data)
         max_value = max(values) if values else 0
         if max_value == 0:
             max_value = 1
 
-        # Layout: chart area + axis + label band
-        left_right_margin = 40
-        top_margin = 30
-        # Give a tall vertical band so full labels can stack downwards
-        label_band = 90
-        bottom_margin = 10
-
-        chart_height = self.height - top_margin - label_band - bottom_margin
+        left_right_margin = self._LR_MARGIN
+        chart_height = self.height - self._TOP_MARGIN - self._LABEL_BAND - self._BOTTOM_MARGIN
         chart_width = self.width - left_right_margin * 2
+        x_axis_y = self._TOP_MARGIN + chart_height
 
         # Spacing between bars
         num_bars = len(values)
@@ -443,39 +754,13 @@ class BarChart(tk.Canvas):
         total_spacing = bar_spacing * (num_bars + 1)
         available_width = max(chart_width - total_spacing, 1)
         bar_width = available_width / num_bars if num_bars > 0 else chart_width
-
-        # Axis baseline at bottom of chart area
-        x_axis_y = top_margin + chart_height
-        self.create_line(
-            left_right_margin,
-            x_axis_y,
-            self.width - left_right_margin,
-            x_axis_y,
-            fill="#2c3e50",
-            width=2,
-        )
-
-        # Horizontal gridlines inside chart area
-        for i in range(5):
-            y = x_axis_y - (i * chart_height / 4)
-            self.create_line(
-                left_right_margin,
-                y,
-                self.width - left_right_margin,
-                y,
-                fill="#ecf0f1",
-                width=1,
-            )
+        # One division outside the loop; per bar it is a multiply
+        scale = chart_height / max_value
 
         # Draw bars and value labels
         colors = ["#3498db", "#2ecc71", "#9b59b6", "#e74c3c", "#f39c12", "#1abc9c"]
 
         # Approximate max characters per line based on bar width (6 px/char at small font)
-        num_bars = len(values)
-        bar_spacing = 10
-        total_spacing = bar_spacing * (num_bars + 1)
-        available_width = max(chart_width - total_spacing, 1)
-        bar_width = available_width / num_bars if num_bars > 0 else chart_width
         max_chars_per_line = max(int(bar_width // 6), 6)
 
         def _wrap_label(text: str) -> str:
@@ -502,21 +787,25 @@ class BarChart(tk.Canvas):
         for idx, value in enumerate(values):
             x0 = left_right_margin + bar_spacing + idx * (bar_width + bar_spacing)
             x1 = x0 + bar_width
-            bar_height = (value / max_value) * chart_height
+            bar_height = value * scale
             y0 = x_axis_y - bar_height  # bar top
             y1 = x_axis_y  # bar bottom on axis
 
-            color = colors[idx % len(colors)]
-            self.create_rectangle(x0, y0, x1, y1, fill=color, outline="", width=0)
+            # Zero-height bars are invisible; skip their rectangle and
+            # value text and keep only the category label below
+            if value != 0:
+                color = colors[idx % len(colors)]
+                self.create_rectangle(x0, y0, x1, y1, fill=color, outline="", width=0, tags=("bars",))
 
-            # Numeric value just above each bar
-            self.create_text(
-                (x0 + x1) / 2,
-                y0 - 6,
-                text=str(value),
-                font=("Helvetica", 8, "bold"),
-                fill="#2c3e50",
-            )
+                # Numeric value just above each bar
+                self.create_text(
+                    (x0 + x1) / 2,
+                    y0 - 6,
+                    text=str(value),
+                    font=("Helvetica", 8, "bold"),
+                    fill="#2c3e50",
+                    tags=("bars",),
+                )
 
             # Category label: below axis, wrapped over multiple small lines (not per-letter)
             raw_label = str(labels[idx])
@@ -529,6 +818,7 @@ class BarChart(tk.Canvas):
                 font=("Helvetica", 7),
                 fill="#34495e",
                 anchor="n",
+                tags=("bars",),
             )
 
 
@@ -538,29 +828,122 @@ class DualBarChart(tk.Canvas):
                          highlightbackground="#cccccc")
         self.width = width
         self.height = height
+        self._title_item: Optional[int] = None
+        self._legend_items: Tuple[int, int] = (0, 0)
+
+    # Use separate top/bottom margins to make space for legend and labels
+    _LR_MARGIN = 40
+    _TOP_MARGIN = 50
+    _LABEL_BAND = 45
+    _BOTTOM_MARGIN = 20
+    # Better colors: blue for first, green for second
+    _COLORS = ["#3498db", "#27ae60"]
+
+    def _ensure_chrome(self) -> None:
+        """Create title, axis, gridlines and legend once; redraws only
+        retext the title/legend and rebuild the "bars" items."""
+        if self._title_item is not None:
+            return
+        self._title_item = self.create_text(
+            self.width // 2, 16, text="", font=("Helvetica", 11, "bold"), fill="#2c3e50"
+        )
+        chart_height = self.height - self._TOP_MARGIN - self._LABEL_BAND - self._BOTTOM_MARGIN
+        x_axis_y = self._TOP_MARGIN + chart_height
+        # Axis baseline at bottom of chart area
+        self.create_line(
+            self._LR_MARGIN,
+            x_axis_y,
+            self.width - self._LR_MARGIN,
+            x_axis_y,
+            fill="#2c3e50",
+            width=2,
+            tags=("grid",),
+        )
+        # Gridlines
+        for i in range(5):
+            y = x_axis_y - (i * chart_height / 4)
+            self.create_line(
+                self._LR_MARGIN,
+                y,
+                self.width - self._LR_MARGIN,
+                y,
+                fill="#ecf0f1",
+                width=1,
+                tags=("grid",),
+            )
+        # Legend - compact, below title area and above bars
+        legend_y = 26
+        self.create_rectangle(
+            self._LR_MARGIN,
+            legend_y,
+            self._LR_MARGIN + 12,
+            legend_y + 12,
+            fill=self._COLORS[0],
+            outline="",
+            tags=("grid",),
+        )
+        first = self.create_text(
+            self._LR_MARGIN + 16,
+            legend_y + 6,
+            text="",
+            anchor=tk.W,
+            font=("Helvetica", 8),
+            fill="#2c3e50",
+            tags=("grid",),
+        )
+        self.create_rectangle(
+            self._LR_MARGIN + 100,
+            legend_y,
+            self._LR_MARGIN + 112,
+            legend_y + 12,
+            fill=self._COLORS[1],
+            outline="",
+            tags=("grid",),
+        )
+        second = self.create_text(
+            self._LR_MARGIN + 116,
+            legend_y + 6,
+            text="",
+            anchor=tk.W,
+            font=("Helvetica", 8),
+            fill="#2c3e50",
+            tags=("grid",),
+        )
+        self._legend_items = (first, second)
 
     def draw(self, data: List[Tuple[str, int, int]], labels: Tuple[str, str] = ("A", "B"), title: str = "") -> None:
-        self.delete("all")
-
-        # Draw title
-        if title:
-            self.create_text(self.width // 2, 16, text=title, font=("Helvetica", 11, "bold"), fill="#2c3e50")
+        self._ensure_chrome()
+        # Static chrome persists across draws; only the bars rebuild
+        self.delete("bars")
+        self.itemconfigure(self._title_item, text=title)
+        self.itemconfigure(self._legend_items[0], text=labels[0])
+        self.itemconfigure(self._legend_items[1], text=labels[1])
 
         if not data:
-            self.create_text(self.width // 2, self.height // 2, text="No data", fill="#95a5a6", font=("Helvetica", 10))
+            self.itemconfigure("grid", state="hidden")
+            self.create_text(
+                self.width // 2,
+                self.height // 2,
+                text="No data",
+                fill="#95a5a6",
+                font=("Helvetica", 10),
+                tags=("bars",),
+            )
             return
-
-        max_value = max(max(a, b) for _, a, b in data)
+        self.itemconfigure("grid", state="normal")
+
+        # Single pass over the pairs instead of a nested max() per group
+        max_value = 0
+        for _, a, b in data:
+            if a > max_value:
+                max_value = a
+            if b > max_value:
+                max_value = b
         if max_value == 0:
             max_value = 1
 
-        # Use separate top/bottom margins to make space for legend and labels
-        left_right_margin = 40
-        top_margin = 50
-        label_band = 45
-        bottom_margin = 20
-
-        chart_height = self.height - top_margin - label_band - bottom_margin
+        left_right_margin = self._LR_MARGIN
+        chart_height = self.height - self._TOP_MARGIN - self._LABEL_BAND - self._BOTTOM_MARGIN
         chart_width = self.width - left_right_margin * 2
 
         # Spacing between bar groups
@@ -593,51 +976,32 @@ class DualBarChart(tk.Canvas):
                     lines[-1] = lines[-1][: max_chars_per_line - 1] + "…"
             return "\n".join(lines)
 
-        # Maximum label width in characters based on group width
-        max_label_chars = max(int(bar_group_width // 6), 4)
-
-        # Axis baseline at bottom of chart area
-        x_axis_y = top_margin + chart_height
-        self.create_line(
-            left_right_margin,
-            x_axis_y,
-            self.width - left_right_margin,
-            x_axis_y,
-            fill="#2c3e50",
-            width=2,
-        )
-
-        # Gridlines
-        for i in range(5):
-            y = x_axis_y - (i * chart_height / 4)
-            self.create_line(
-                left_right_margin,
-                y,
-                self.width - left_right_margin,
-                y,
-                fill="#ecf0f1",
-                width=1,
-            )
-
-        # Better colors: blue for first, green for second
-        colors = ["#3498db", "#27ae60"]
+        # Axis baseline position (the line itself lives in the chrome)
+        x_axis_y = self._TOP_MARGIN + chart_height
+        colors = self._COLORS
+        # One division outside the loop; per bar it is a multiply
+        scale = chart_height / max_value
 
         for idx, (label, val1, val2) in enumerate(data):
             base_x = left_right_margin + group_spacing + idx * (bar_group_width + group_spacing)
             for jdx, value in enumerate((val1, val2)):
+                # Invisible zero-height bar; the group label still draws
+                if value == 0:
+                    continue
                 x0 = base_x + jdx * bar_width + 3
                 x1 = x0 + bar_width - 3
-                bar_height = (value / max_value) * chart_height
+                bar_height = value * scale
                 y0 = x_axis_y - bar_height
                 y1 = x_axis_y
                 color = colors[jdx]
-                self.create_rectangle(x0, y0, x1, y1, fill=color, outline="", width=0)
+                self.create_rectangle(x0, y0, x1, y1, fill=color, outline="", width=0, tags=("bars",))
                 self.create_text(
                     (x0 + x1) / 2,
                     y0 - 6,
                     text=str(value),
                     font=("Helvetica", 8, "bold"),
                     fill="#2c3e50",
+                    tags=("bars",),
                 )
 
             # X-axis label: below axis, wrapped over multiple lines
@@ -652,43 +1016,9 @@ class DualBarChart(tk.Canvas):
                 font=("Helvetica", 7),
                 fill="#34495e",
                 anchor="n",
+                tags=("bars",),
             )
 
-        # Legend - compact
-        legend_y = 26  # below title area, above bars
-        self.create_rectangle(
-            left_right_margin,
-            legend_y,
-            left_right_margin + 12,
-            legend_y + 12,
-            fill=colors[0],
-            outline="",
-        )
-        self.create_text(
-            left_right_margin + 16,
-            legend_y + 6,
-            text=labels[0],
-            anchor=tk.W,
-            font=("Helvetica", 8),
-            fill="#2c3e50",
-        )
-        self.create_rectangle(
-            left_right_margin + 100,
-            legend_y,
-            left_right_margin + 112,
-            legend_y + 12,
-            fill=colors[1],
-            outline="",
-        )
-        self.create_text(
-            left_right_margin + 116,
-            legend_y + 6,
-            text=labels[1],
-            anchor=tk.W,
-            font=("Helvetica", 8),
-            fill="#2c3e50",
-        )
-
 
 class PillButton(tk.Canvas):
     def __init__(self, master: tk.Misc, text: str, command: Callable[[], None], variant: str = "default",
@@ -2,7 +2,7 @@
 
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional
 
 from services import (
     add_stock_topup,
@@ -13,6 +13,7 @@ from services import (
     get_daily_pay_rate,
     list_camps,
     list_messages_lines,
+    list_messages_lines_since,
     list_stock_topups,
     post_message,
     set_daily_pay_rate,
@@ -22,6 +23,34 @@ from ui.components import BarChart, DualBarChart, MessageBoard, ScrollFrame
 from ui.theme import get_palette, tint
 
 
+def _show_shortage_window(root: tk.Misc, camp_names: List[str]) -> None:
+    """Scrollable Toplevel for a long list of shortage alerts.
+
+    A messagebox grows with its text and cannot scroll, so past a handful
+    of camps the list moves into a ScrollFrame; rows are plain labels
+    built once, which stays cheap at any realistic camp count.
+    """
+    win = tk.Toplevel(root)
+    win.title("Food Shortage Alert")
+    win.geometry("420x360")
+    ttk.Label(
+        win,
+        text=f"⚠️ {len(camp_names)} camps have food shortages:",
+        font=("Helvetica", 12, "bold"),
+    ).pack(anchor=tk.W, padx=12, pady=(12, 6))
+    scroll = ScrollFrame(win)
+    scroll.pack(fill=tk.BOTH, expand=True, padx=12)
+    for name in camp_names:
+        ttk.Label(scroll.content, text=f"• {name}").pack(anchor=tk.W, pady=1)
+    ttk.Label(
+        win,
+        text="Food stock is projected to go below the planned level.\n"
+        "Please check the Analytics tab for details and add stock top-ups.",
+        style="Muted.TLabel",
+    ).pack(anchor=tk.W, padx=12, pady=6)
+    ttk.Button(win, text="Close", command=win.destroy).pack(pady=(0, 10))
+
+
 def _check_and_notify_shortages(root: tk.Misc) -> None:
     """Check for food shortages and show popup notification if any exist."""
     alerts = get_food_shortage_alerts()
@@ -33,6 +62,10 @@ def _check_and_notify_shortages(root: tk.Misc) -> None:
     
     if len(camp_names) == 1:
         message = f"⚠️ Food Shortage Detected\n\nCamp: {camp_names[0]}\n\nFood stock is projected to go below the planned level during this camp's duration.\n\nPlease check the Analytics tab for details and add stock top-ups."
+    elif len(camp_names) > 10:
+        # A long list would produce an unreadable, unscrollable dialog
+        _show_shortage_window(root, camp_names)
+        return
     else:
         camps_list = "\n• ".join(camp_names)
         message = f"⚠️ Food Shortage Detected\n\n{len(camp_names)} camps have food shortages:\n\n• {camps_list}\n\nFood stock is projected to go below the planned level.\n\nPlease check the Analytics tab for details and add stock top-ups."
@@ -987,6 +1020,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         tab_chat,
         post_callback=lambda content: post_message(user.get("id"), content),
         fetch_callback=lambda: list_messages_lines(),
+        incremental_fetch=list_messages_lines_since,
         current_user=user.get("username"),
     ).grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
 
@@ -2,10 +2,13 @@
 
 import tkinter as tk
 import os
+from datetime import datetime
 import json
 import sqlite3
+import threading
+from itertools import cycle
 from tkinter import filedialog, messagebox, simpledialog, ttk
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from services import (
     assign_campers_to_activity,
@@ -14,16 +17,21 @@ from services import (
     create_activity,
     delete_activity,
     update_activity,
+    count_activity_campers,
     delete_daily_report,
     get_leader_statistics,
+    get_leader_summary,
+    get_tab_snapshot,
     import_campers_from_csv,
     list_activity_campers,
     list_available_camps_for_leader,
     list_camp_activities,
     list_camp_campers,
+    count_daily_reports,
     list_daily_reports,
     list_leader_assignments,
     list_messages_lines,
+    list_messages_lines_since,
     get_leader_pay_summary,
     post_message,
     remove_leader_assignment,
@@ -36,22 +44,26 @@ from services import (
     validate_camper_name,
     # Parent/consent features
     list_users,
-    list_parent_campers,
-    get_consent_form,
     add_parent_camper,
     list_camps_for_camper,
     list_camps_for_parent,
     submit_consent_form,
     list_daily_reports_for_camper,
     submit_feedback,
-    has_consent_for_camp,
-    get_camper_parent_info,
+    list_parent_campers_bulk,
+    list_consent_forms_for_camp,
+    get_consent_map,
     is_camper_over_18,
     is_parent_linked_to_camper,
 )
 
-from ui.components import MessageBoard, Table, ScrollFrame
-from ui.theme import get_palette, tint
+from ui.async_utils import run_async
+from ui.components import MessageBoard, Table, ScrollFrame, apply_zebra_tags, bulk_insert_rows
+from ui.theme import get_palette
+
+# Zebra-stripe tag tuples shared by every insert loop
+_EVEN_TAG = ("even",)
+_ODD_TAG = ("odd",)
 
 
 def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callable[[], None]) -> tk.Frame:
@@ -156,31 +168,42 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
     assignments_empty_label = ttk.Label(assignments_frame, text="No assignments yet.", style="Muted.TLabel")
     assignments_empty_label.pack_forget()
+    apply_zebra_tags(assignments_table)
+
+    # Assignment records keyed by id so handlers can recover a record
+    # from the table selection without re-querying and scanning
+    assignments_by_id: Dict[int, Dict[str, Any]] = {}
 
     def refresh_assignments() -> None:
-        assignments_table.delete(*assignments_table.get_children())
-        palette = get_palette(assignments_table)
-        assignments_table.tag_configure("even", background=palette["surface"])
-        assignments_table.tag_configure("odd", background=tint(palette["surface"], -0.03))
-        rows = list_leader_assignments(leader_id)
+        run_async(assignments_table, list_leader_assignments, leader_id, on_done=_populate_assignments)
+
+    def _populate_assignments(rows: List[Dict[str, Any]]) -> None:
+        assignments_by_id.clear()
+        assignments_by_id.update({rec["id"]: rec for rec in rows})
         if not rows:
             assignments_empty_label.pack(pady=(0, 4), anchor=tk.W)
         else:
             assignments_empty_label.pack_forget()
-        for idx, record in enumerate(rows):
-            assignments_table.insert(
-                "",
-                tk.END,
-                iid=record["id"],
-                values=(
-                    record["name"],
-                    record["location"],
-                    record.get("area", ""),
-                    record["start_date"],
-                    record["end_date"],
-                ),
-                tags=("odd",) if (idx % 2 == 1) else ("even",),
-            )
+        assignments_table.delete(*assignments_table.get_children())
+        tag_cycle = cycle((_EVEN_TAG, _ODD_TAG))
+        # One Tcl eval for all rows instead of one insert call per row
+        bulk_insert_rows(
+            assignments_table,
+            (
+                (
+                    record["id"],
+                    (
+                        record["name"],
+                        record["location"],
+                        record.get("area", ""),
+                        record["start_date"],
+                        record["end_date"],
+                    ),
+                    next(tag_cycle),
+                )
+                for record in rows
+            ),
+        )
         refresh_available_camps()
 
     tk.Label(assignments_frame, text="Available camps (no conflicts)").pack(pady=(10, 4))
@@ -204,31 +227,35 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
     available_empty_label = ttk.Label(assignments_frame, text="No available camps.", style="Muted.TLabel")
     available_empty_label.pack_forget()
+    apply_zebra_tags(available_table)
 
     def refresh_available_camps() -> None:
-        available_table.delete(*available_table.get_children())
-        palette = get_palette(available_table)
-        available_table.tag_configure("even", background=palette["surface"])
-        available_table.tag_configure("odd", background=tint(palette["surface"], -0.03))
-        rows = list_available_camps_for_leader(leader_id)
+        run_async(available_table, list_available_camps_for_leader, leader_id, on_done=_populate_available_camps)
+
+    def _populate_available_camps(rows: List[Dict[str, Any]]) -> None:
         if not rows:
             available_empty_label.pack(pady=(0, 4), anchor=tk.W)
         else:
             available_empty_label.pack_forget()
-        for idx, camp in enumerate(rows):
-            available_table.insert(
-                "",
-                tk.END,
-                iid=camp["id"],
-                values=(
-                    camp["name"],
-                    camp["location"],
-                    camp.get("area", ""),
-                    camp["start_date"],
-                    camp["end_date"],
-                ),
-                tags=("odd",) if (idx % 2 == 1) else ("even",),
-            )
+        available_table.delete(*available_table.get_children())
+        tag_cycle = cycle((_EVEN_TAG, _ODD_TAG))
+        bulk_insert_rows(
+            available_table,
+            (
+                (
+                    camp["id"],
+                    (
+                        camp["name"],
+                        camp["location"],
+                        camp.get("area", ""),
+                        camp["start_date"],
+                        camp["end_date"],
+                    ),
+                    next(tag_cycle),
+                )
+                for camp in rows
+            ),
+        )
 
     def assign_selected_camp() -> None:
         selection = available_table.selection()
@@ -379,7 +406,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
     def refresh_camp_selector() -> None:
         nonlocal label_to_camp_id, selected_camp_for_campers
-        rows = list_leader_assignments(leader_id)
+        rows = list(assignments_by_id.values())
         label_to_camp_id = {}
         values = []
         for rec in rows:
@@ -413,8 +440,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         """Ensure the Camps tab assignment table selection matches the given camp."""
         if camp_id is None:
             return
-        rows = list_leader_assignments(leader_id)
-        for rec in rows:
+        for rec in assignments_by_id.values():
             if rec.get("camp_id") == camp_id:
                 try:
                     assignments_table.selection_set(rec["id"])
@@ -610,7 +636,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         if not selection:
             return
         assignment_id = int(selection[0])
-        record = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        record = assignments_by_id.get(assignment_id)
         if record is None:
             return
         camp_id = record["camp_id"]
@@ -903,6 +929,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
                     messagebox.showerror("Edit camper", f"Failed to update food units/day: {exc}")
                     return
                 # debug removed
+                _invalidate_stats()
                 # Refresh view and close
                 try:
                     load_campers_for_selection()
@@ -913,6 +940,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
                 camper_id = int(camper.get("camper_id"))
                 if messagebox.askyesno('Remove_camper','Are you sure you want to remove this camper? This action cannot be undone.'):
                     delete_camper(camper_id)
+                    _invalidate_stats()
                     dialog.destroy()
                     load_campers_for_selection()
                 else:
@@ -936,6 +964,15 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             for child in getattr(widget, "winfo_children", lambda: [])():
                 _bind_card_click(child, camper)
 
+        # Bulk-fetch parent links and consent pairs once for the whole
+        # gallery instead of two queries per camper card
+        parents_by_camper = list_parent_campers_bulk()
+        if selected_camp_for_campers and selected_camp_for_campers > 0:
+            consent_pairs = list_consent_forms_for_camp(selected_camp_for_campers)
+        else:
+            consent_pairs = set()
+        consented_camper_ids = {camper_id for _parent_id, camper_id in consent_pairs}
+
         for camper in campers:
             card = ttk.Frame(gallery_content, style="Card.TFrame", padding=8)
             # Image or initials
@@ -959,8 +996,9 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             if is_over_18:
                 ttk.Label(card, text="🔷 Over 18", font=("Helvetica", 9), foreground="#2563eb").pack()
             
-            # Parent linked info
-            parent_info = get_camper_parent_info(camper_id) if camper_id else None
+            # Parent linked info (from the bulk map, first linked parent)
+            linked_parents = parents_by_camper.get(camper_id) if camper_id else None
+            parent_info = linked_parents[0] if linked_parents else None
             if is_over_18:
                 ttk.Label(card, text="Parent linked: Above 18", style="Muted.TLabel").pack()
             elif parent_info:
@@ -970,7 +1008,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             
             # Consent status (only for under 18)
             if not is_over_18 and selected_camp_for_campers and selected_camp_for_campers > 0:
-                has_consent = has_consent_for_camp(camper_id, selected_camp_for_campers)
+                has_consent = camper_id in consented_camper_ids
                 consent_text = "✓ Consent given" if has_consent else "✗ No consent"
                 consent_color = "#16a34a" if has_consent else "#dc2626"
                 ttk.Label(card, text=consent_text, font=("Helvetica", 9), foreground=consent_color).pack()
@@ -1027,7 +1065,9 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
                     pass
                 campers_empty_label.pack(pady=(0, 4), anchor=tk.W)
                 return
-        campers = list_camp_campers(target_camp_id)
+        run_async(gallery_content, list_camp_campers, target_camp_id, on_done=_show_campers)
+
+    def _show_campers(campers: List[Dict[str, Any]]) -> None:
         # Apply active search filter if present
         scope = active_search.get("scope")
         query = (active_search.get("value") or "").strip()
@@ -1137,7 +1177,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Import", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             messagebox.showerror("Import", "Assignment not found.")
             return
@@ -1147,18 +1187,28 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         )
         if not file_path:
             return
-        try:
-            result = import_campers_from_csv(assignment["camp_id"], file_path)
-        except Exception as exc:
-            messagebox.showerror("Import", f"Failed to import: {exc}")
-            return
-        skipped_overlap = result.get('skipped_overlap', 0)
-        overlap_msg = f"\n\nThese campers are already in a different camp with another leader at the same time:\n" + "\n".join(f"• {e}" for e in result['errors'] if 'same time' in e) if skipped_overlap > 0 else ""
-        messagebox.showinfo(
-            "Import complete",
-            f"Created: {result['created']}\nLinked: {result['linked']}\nDuplicates skipped: {result['duplicates']}\nCampers skipped (overlapping camps): {skipped_overlap}\nTotal errors: {len(result['errors'])}{overlap_msg}",
-        )
-        load_campers_for_selection()
+
+        def _show_import_result(result: Dict[str, Any]) -> None:
+            _invalidate_stats()
+            skipped_overlap = result.get('skipped_overlap', 0)
+            overlap_msg = f"\n\nThese campers are already in a different camp with another leader at the same time:\n" + "\n".join(f"• {e}" for e in result['errors'] if 'same time' in e) if skipped_overlap > 0 else ""
+            messagebox.showinfo(
+                "Import complete",
+                f"Created: {result['created']}\nLinked: {result['linked']}\nDuplicates skipped: {result['duplicates']}\nCampers skipped (overlapping camps): {skipped_overlap}\nTotal errors: {len(result['errors'])}{overlap_msg}",
+            )
+            load_campers_for_selection()
+
+        def _do_import() -> None:
+            # Runs on a worker thread so a large CSV doesn't freeze the UI;
+            # the service opens its own connection so this is thread-safe.
+            try:
+                result = import_campers_from_csv(assignment["camp_id"], file_path)
+            except Exception as exc:
+                container.after(0, lambda exc=exc: messagebox.showerror("Import", f"Failed to import: {exc}"))
+                return
+            container.after(0, lambda: _show_import_result(result))
+
+        threading.Thread(target=_do_import, daemon=True).start()
 
     def adjust_food_units() -> None:
         selection = assignments_table.selection()
@@ -1166,7 +1216,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Food", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
         campers = list_camp_campers(assignment["camp_id"])
@@ -1188,11 +1238,14 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
         listbox = tk.Listbox(dialog)
         listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        for idx, camper in enumerate(campers):
-            listbox.insert(
-                tk.END,
-                f"{camper['first_name']} {camper['last_name']} - {camper['food_units_per_day']} units",
-            )
+        # One variadic insert instead of one Tcl call per camper
+        listbox.insert(
+            tk.END,
+            *(
+                f"{camper['first_name']} {camper['last_name']} - {camper['food_units_per_day']} units"
+                for camper in campers
+            ),
+        )
 
         def update_selected() -> None:
             sel = listbox.curselection()
@@ -1210,6 +1263,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             if amount is None:
                 return
             update_camp_camper_food(camper["id"], amount)
+            _invalidate_stats()
             campers[idx]["food_units_per_day"] = amount
             listbox.delete(idx)
             listbox.insert(
@@ -1245,37 +1299,46 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     activities_empty_label = ttk.Label(activities_frame, text="No activities for the selected camp.", style="Muted.TLabel")
     activities_empty_label.pack_forget()
 
-    def load_activities() -> None:
-        activities_table.load_rows([])
-        # Prefer the in-tab Campers selector if it has an active camp
+    # Activity records keyed by id; rows are inserted with the activity
+    # id as iid, so a selection resolves with a dict hit and no scan
+    activities_by_id: Dict[int, Dict[str, Any]] = {}
+
+    def _resolve_active_camp_id() -> Optional[int]:
+        # Prefer the in-tab Campers selector if it has an active camp,
+        # falling back to the current assignment selection in the Camps tab.
         camp_id: Optional[int] = selected_camp_for_campers
         if camp_id in (None, -1):
-            # Fallback: use current assignment selection in Camps tab
             selection = assignments_table.selection()
             if not selection:
-                return
-            assignment_id = int(selection[0])
-            assignment = next(
-                (rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id),
-                None,
-            )
+                return None
+            assignment = assignments_by_id.get(int(selection[0]))
             if assignment is None:
-                return
+                return None
             camp_id = assignment["camp_id"]
         if camp_id in (None, -1):
-            return
-        activities = list_camp_activities(camp_id)
-        rows = []
-        for activity in activities:
-            participants = list_activity_campers(activity["id"])
-            rows.append((activity["name"], activity["date"], len(participants)))
-        activities_table.load_rows(rows)
-        # Zebra-striping after load
-        palette = get_palette(activities_table)
-        activities_table.tag_configure("even", background=palette["surface"])
-        activities_table.tag_configure("odd", background=tint(palette["surface"], -0.03))
-        for idx, item_id in enumerate(activities_table.get_children()):
-            activities_table.item(item_id, tags=("odd",) if (idx % 2 == 1) else ("even",))
+            return None
+        return camp_id
+
+    def load_activities(preloaded: Optional[Dict[str, Any]] = None) -> None:
+        if preloaded is not None:
+            activities = preloaded["activities"]
+            counts = preloaded["activity_counts"]
+        else:
+            activities_table.load_rows([])
+            camp_id = _resolve_active_camp_id()
+            if camp_id is None:
+                return
+            activities = list_camp_activities(camp_id)
+            counts = count_activity_campers(camp_id)
+        activities_by_id.clear()
+        activities_by_id.update({activity["id"]: activity for activity in activities})
+        rows = [
+            (activity["name"], activity["date"], counts.get(activity["id"], 0))
+            for activity in activities
+        ]
+        activities_table.load_rows(
+            rows, iids=[activity["id"] for activity in activities], striped=True
+        )
         # Empty state toggle
         if not rows:
             activities_empty_label.pack(pady=(0, 4), anchor=tk.W)
@@ -1288,7 +1351,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Activity", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
 
@@ -1316,9 +1379,8 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
                 # Parse date for further validation
             try:
-                import pandas as pd
-                date_dt = pd.to_datetime(date)
-            except Exception:
+                date_dt = datetime.strptime(date, "%Y-%m-%d")
+            except ValueError:
                 messagebox.showerror("Activity", "Invalid date format.")
                 return
 
@@ -1326,9 +1388,9 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             # Validate date within camp range
             camp = get_camp(assignment["camp_id"])
             try:
-                start_dt = pd.to_datetime(camp["start_date"], format="%Y-%m-%d")
-                end_dt = pd.to_datetime(camp["end_date"], format="%Y-%m-%d")
-            except Exception:
+                start_dt = datetime.strptime(camp["start_date"], "%Y-%m-%d")
+                end_dt = datetime.strptime(camp["end_date"], "%Y-%m-%d")
+            except (TypeError, ValueError):
                 messagebox.showerror("Activity", "Could not read camp dates for validation.")
                 return
             if date_dt < start_dt or date_dt > end_dt:
@@ -1340,6 +1402,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             if not create_activity(assignment["camp_id"], name, date):
                 messagebox.showerror("Activity", "Failed to create activity.")
                 return
+            _invalidate_stats()
             dialog.destroy()
             load_activities()
 
@@ -1352,7 +1415,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Activity", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection_assignment[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
 
@@ -1360,16 +1423,15 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         if not selection:
             messagebox.showinfo("Activity", "Select an activity to delete.")
             return
-        index = activities_table.index(selection[0])
-        activities = list_camp_activities(assignment["camp_id"])
-        if index >= len(activities):
+        activity = activities_by_id.get(int(selection[0]))
+        if activity is None:
             return
-        activity = activities[index]
         if not messagebox.askyesno("Activity", "Delete this activity?"):
             return
         if not delete_activity(activity["id"], assignment["camp_id"]):
             messagebox.showerror("Activity", "Failed to delete.")
             return
+        _invalidate_stats()
         load_activities()
 
     def assign_campers_to_selected_activity() -> None:
@@ -1378,7 +1440,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Activity", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection_assignment[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
 
@@ -1386,11 +1448,9 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         if not selection_activity:
             messagebox.showinfo("Activity", "Select an activity first.")
             return
-        index = activities_table.index(selection_activity[0])
-        activities = list_camp_activities(assignment["camp_id"])
-        if index >= len(activities):
+        activity = activities_by_id.get(int(selection_activity[0]))
+        if activity is None:
             return
-        activity = activities[index]
 
         campers = list_camp_campers(assignment["camp_id"])
         if not campers:
@@ -1419,6 +1479,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
         # Store mapping from listbox index to camper data
         camper_data_by_index = []
+        labels = []
 
         for idx, camper in enumerate(campers):
             name = f"{camper['first_name']} {camper['last_name']}"
@@ -1428,7 +1489,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             if is_assigned:
                 name = f"✓ {name} (already assigned)"
 
-            listbox.insert(tk.END, name)
+            labels.append(name)
 
             # Store camper data
             camper_data_by_index.append({
@@ -1442,6 +1503,9 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             # if not is_assigned:
             #     listbox.selection_set(idx)
 
+        # One variadic insert instead of one Tcl call per camper
+        listbox.insert(tk.END, *labels)
+
         def assign_selected() -> None:
             sel_indices = listbox.curselection()
             if not sel_indices:
@@ -1453,6 +1517,9 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             newly_selected_count = 0
             no_consent_campers = []
 
+            # One grouped query replaces a consent lookup per selected camper
+            consent_map = get_consent_map(assignment["camp_id"])
+
             for idx in sel_indices:
                 camper_data = camper_data_by_index[idx]
                 camper_id = camper_data["camper_id"]
@@ -1463,7 +1530,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
                 camper_over_18 = is_camper_over_18(camper_dob)
                 
                 # Over 18 campers don't need consent
-                if not camper_over_18 and not has_consent_for_camp(camper_id, assignment["camp_id"]):
+                if not camper_over_18 and not consent_map.get(camper_id):
                     no_consent_campers.append(camper_data["name"].replace("✓ ", "").replace(" (already assigned)", ""))
                     continue
                 
@@ -1487,6 +1554,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
             try:
                 assign_campers_to_activity(activity["id"], selected_camper_ids)
+                _invalidate_stats()
 
                 if newly_selected_count == len(sel_indices):
                     message = f"Successfully assigned {newly_selected_count} camper(s) to activity."
@@ -1553,7 +1621,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Activity", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection_assignment[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
 
@@ -1561,11 +1629,9 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         if not selection_activity:
             messagebox.showinfo("Activity", "Select an activity first.")
             return
-        index = activities_table.index(selection_activity[0])
-        activities = list_camp_activities(assignment["camp_id"])
-        if index >= len(activities):
+        activity = activities_by_id.get(int(selection_activity[0]))
+        if activity is None:
             return
-        activity = activities[index]
 
         # Get currently assigned campers
         assigned_campers = list_activity_campers(activity["id"])
@@ -1585,11 +1651,12 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         listbox = tk.Listbox(dialog, selectmode=tk.MULTIPLE, height=12)
         listbox.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        camper_ids_by_index = []
-        for camper in assigned_campers:
-            name = f"{camper['first_name']} {camper['last_name']}"
-            listbox.insert(tk.END, name)
-            camper_ids_by_index.append(camper["id"])
+        camper_ids_by_index = [camper["id"] for camper in assigned_campers]
+        # One variadic insert instead of one Tcl call per camper
+        listbox.insert(
+            tk.END,
+            *(f"{camper['first_name']} {camper['last_name']}" for camper in assigned_campers),
+        )
 
         def do_unassign() -> None:
             sel_indices = listbox.curselection()
@@ -1599,6 +1666,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             
             selected_ids = [camper_ids_by_index[idx] for idx in sel_indices]
             unassign_campers_from_activity(activity["id"], selected_ids)
+            _invalidate_stats()
             messagebox.showinfo("Success", f"Unassigned {len(selected_ids)} camper(s) from activity.")
             dialog.destroy()
             load_activities()
@@ -1622,18 +1690,16 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Activity", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection_assignment[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
         selection_activity = activities_table.selection()
         if not selection_activity:
             messagebox.showinfo("Activity", "Select an activity to edit.")
             return
-        index = activities_table.index(selection_activity[0])
-        activities = list_camp_activities(assignment["camp_id"])
-        if index >= len(activities):
+        activity = activities_by_id.get(int(selection_activity[0]))
+        if activity is None:
             return
-        activity = activities[index]
         dialog = tk.Toplevel(container)
         dialog.title("Edit activity")
         dialog.geometry("360x220")
@@ -1654,18 +1720,17 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
                 # Parse date for further validation
             try:
-                import pandas as pd
-                date_dt = pd.to_datetime(date)
-            except Exception:
+                date_dt = datetime.strptime(date, "%Y-%m-%d")
+            except ValueError:
                 messagebox.showerror("Activity", "Invalid date format.")
                 return
 
             # Validate date within camp range
             camp = get_camp(assignment["camp_id"])
             try:
-                start_dt = pd.to_datetime(camp["start_date"], format="%Y-%m-%d")
-                end_dt = pd.to_datetime(camp["end_date"], format="%Y-%m-%d")
-            except Exception:
+                start_dt = datetime.strptime(camp["start_date"], "%Y-%m-%d")
+                end_dt = datetime.strptime(camp["end_date"], "%Y-%m-%d")
+            except (TypeError, ValueError):
                 messagebox.showerror("Activity", "Could not read camp dates for validation.")
                 return
             if date_dt < start_dt or date_dt > end_dt:
@@ -1677,6 +1742,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             if not update_activity(activity["id"], assignment["camp_id"], name, date):
                 messagebox.showerror("Activity", "Failed to update activity.")
                 return
+            _invalidate_stats()
             dialog.destroy()
             load_activities()
         ttk.Button(dialog, text="Save", command=save_edit).pack(pady=8)
@@ -1686,21 +1752,62 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     ttk.Button(activities_actions, text="Bulk assign campers", command=assign_campers_to_selected_activity).pack(side=tk.LEFT, padx=4)
     ttk.Button(activities_actions, text="Unassign campers", command=unassign_campers_from_selected_activity).pack(side=tk.LEFT, padx=4)
 
+    last_assignment_id: Optional[int] = None
+
     def refresh_current_assignment_details() -> None:
+        nonlocal last_assignment_id
+        # <<TreeviewSelect>> also fires on focus changes; skip the whole
+        # three-tab refresh when the selected assignment is unchanged.
+        selection = assignments_table.selection()
+        new_id = int(selection[0]) if selection else None
+        if new_id == last_assignment_id:
+            return
+        last_assignment_id = new_id
         # Always keep the in-tab selector in sync with assignment selection
         _sync_selector_to_assignment()
-        load_campers_for_selection()
-        load_activities()
-        refresh_daily_reports()
+        camp_id = _resolve_active_camp_id()
+        if camp_id is None:
+            # Let each loader paint its own empty state
+            load_campers_for_selection()
+            load_activities()
+            refresh_daily_reports()
+            return
+
+        def _apply_snapshot(snapshot: Dict[str, Any]) -> None:
+            _show_campers(snapshot["campers"])
+            load_activities(preloaded=snapshot)
+            refresh_daily_reports(preloaded=snapshot)
+
+        # One connection, one worker round-trip for all three detail tabs
+        run_async(
+            container,
+            get_tab_snapshot,
+            leader_id,
+            camp_id,
+            reports_page_size,
+            on_done=_apply_snapshot,
+        )
+
+    details_refresh_pending: Optional[str] = None
+
+    def _do_details_refresh() -> None:
+        nonlocal details_refresh_pending
+        details_refresh_pending = None
+        refresh_current_assignment_details()
 
     def _on_assignments_select(_evt=None) -> None:
+        nonlocal details_refresh_pending
         # When an assigned camp is selected, clear any selection in the
         # available camps list so only one camp is effectively active.
         try:
             available_table.selection_remove(*available_table.get_children())
         except Exception:
             pass
-        refresh_current_assignment_details()
+        # Collapse bursts of selection events (arrow-key scrubbing) into
+        # a single refresh of the three detail tabs.
+        if details_refresh_pending is not None:
+            container.after_cancel(details_refresh_pending)
+        details_refresh_pending = container.after(50, _do_details_refresh)
 
     assignments_table.bind("<<TreeviewSelect>>", _on_assignments_select)
 
@@ -1730,7 +1837,8 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     reports_table.heading("Notes", text="Notes (click row to view full message)")
     reports_table.column("Date", width=120, minwidth=100, stretch=False)
     reports_table.column("Notes", width=400, minwidth=300, stretch=True)
-    
+    apply_zebra_tags(reports_table)
+
     # Detail view for full message
     ttk.Label(reports_frame, text="Full Message:", font=("Helvetica", 10, "bold")).grid(row=2, column=0, sticky="w", pady=(0, 4))
     detail_frame = ttk.Frame(reports_frame, style="Card.TFrame", padding=5)
@@ -1742,53 +1850,82 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     detail_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     detail_scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-    def refresh_daily_reports() -> None:
+    # Paged loading state: only one page of reports is fetched at a time and
+    # further pages are pulled in when the user scrolls to the bottom.
+    reports_page_size = 50
+    reports_camp_id: Optional[int] = None
+    reports_offset = 0
+    reports_total = 0
+    report_notes_by_id: Dict[int, Dict[str, Any]] = {}
+
+    def append_report_rows(reports, start_idx: int) -> None:
+        tag_cycle = cycle((_EVEN_TAG, _ODD_TAG))
+        if start_idx % 2:
+            next(tag_cycle)
+        for tags, report in zip(tag_cycle, reports):
+            report_notes_by_id[report["id"]] = report
+            # Truncate notes for table display
+            notes = report["notes"]
+            display_notes = (notes[:80] + "...") if len(notes) > 80 else notes
+            item_id = reports_table.insert(
+                "",
+                tk.END,
+                iid=str(report["id"]),  # Store report ID as tree item ID
+                values=(report["date"], display_notes),
+                tags=tags,
+            )
+            # Store full notes in item for retrieval
+            reports_table.set(item_id, "#1", report["date"])  # Keep date
+
+    def refresh_daily_reports(preloaded: Optional[Dict[str, Any]] = None) -> None:
+        nonlocal reports_camp_id, reports_offset, reports_total
         # Clear the table and detail view
         for item in reports_table.get_children():
             reports_table.delete(item)
+        report_notes_by_id.clear()
+        reports_camp_id = None
+        reports_offset = 0
+        reports_total = 0
         detail_text.config(state="normal")
         detail_text.delete("1.0", tk.END)
         detail_text.insert("1.0", "Select a report to view the full message.")
         detail_text.config(state="disabled")
 
-        # Prefer the in-tab selector's camp if available
-        camp_id: Optional[int] = selected_camp_for_campers
-        if camp_id in (None, -1):
-            selection = assignments_table.selection()
-            if not selection:
-                return
-            assignment_id = int(selection[0])
-            assignment = next(
-                (rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id),
-                None,
-            )
-            if assignment is None:
+        if preloaded is not None:
+            camp_id: Optional[int] = preloaded["camp_id"]
+            total = preloaded["reports_total"]
+            reports = preloaded["reports"]
+        else:
+            camp_id = _resolve_active_camp_id()
+            if camp_id is None:
                 return
-            camp_id = assignment["camp_id"]
-        if camp_id in (None, -1):
+            total = count_daily_reports(leader_id, camp_id)
+            reports = list_daily_reports(leader_id, camp_id, limit=reports_page_size, offset=0)
+
+        reports_camp_id = camp_id
+        reports_total = total
+        reports_offset = len(reports)
+        append_report_rows(reports, 0)
+
+    def load_more_reports(event=None) -> None:
+        nonlocal reports_offset
+        if reports_camp_id is None or reports_offset >= reports_total:
+            return
+        # Only fetch the next page once the view has reached the bottom
+        if reports_table.yview()[1] < 1.0:
             return
+        reports = list_daily_reports(
+            leader_id, reports_camp_id, limit=reports_page_size, offset=reports_offset
+        )
+        start_idx = reports_offset
+        reports_offset += len(reports)
+        append_report_rows(reports, start_idx)
 
-        reports = list_daily_reports(leader_id, camp_id)
+    reports_table.bind("<MouseWheel>", load_more_reports, add="+")
+    reports_table.bind("<Button-4>", load_more_reports, add="+")
+    reports_table.bind("<Button-5>", load_more_reports, add="+")
 
-        # Zebra-striping
-        palette = get_palette(reports_table)
-        reports_table.tag_configure("even", background=palette["surface"])
-        reports_table.tag_configure("odd", background=tint(palette["surface"], -0.03))
 
-        for idx, report in enumerate(reports):
-            # Truncate notes for table display
-            notes = report["notes"]
-            display_notes = (notes[:80] + "...") if len(notes) > 80 else notes
-            item_id = reports_table.insert(
-                "",
-                tk.END,
-                iid=str(report["id"]),  # Store report ID as tree item ID
-                values=(report["date"], display_notes),
-                tags=("odd",) if (idx % 2 == 1) else ("even",)
-            )
-            # Store full notes in item for retrieval
-            reports_table.set(item_id, "#1", report["date"])  # Keep date
-    
     def show_report_detail(event=None) -> None:
         selection = reports_table.selection()
         if not selection:
@@ -1801,19 +1938,13 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             return
         date = values[0]
         
-        # Get full notes from original data by report ID
-        assignment_selection = assignments_table.selection()
-        if assignment_selection:
-            assignment_id = int(assignment_selection[0])
-            assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
-            if assignment:
-                reports = list_daily_reports(leader_id, assignment["camp_id"])
-                matching_report = next((r for r in reports if r["id"] == report_id), None)
-                if matching_report:
-                    detail_text.config(state="normal")
-                    detail_text.delete("1.0", tk.END)
-                    detail_text.insert("1.0", f"Date: {date}\n\n{matching_report['notes']}")
-                    detail_text.config(state="disabled")
+        # Get full notes from the loaded pages by report ID
+        matching_report = report_notes_by_id.get(report_id)
+        if matching_report:
+            detail_text.config(state="normal")
+            detail_text.delete("1.0", tk.END)
+            detail_text.insert("1.0", f"Date: {date}\n\n{matching_report['notes']}")
+            detail_text.config(state="disabled")
     
     reports_table.bind("<<TreeviewSelect>>", show_report_detail)
 
@@ -1825,7 +1956,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Report", "Select an assignment from 'Camps' tab first.")
             return False
         assignment_id = int(selection[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return False
 
@@ -1835,8 +1966,6 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
         camp = get_camp(assignment["camp_id"])
         try:
-            import pandas as pd
-
             # Normalize date first to handle 1-digit months/days
             parts = date.split('-')
             if len(parts) != 3:
@@ -1845,9 +1974,9 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             normalized_date = f"{year}-{month}-{day}"
 
             # Parse dates
-            date_dt = pd.to_datetime(normalized_date, format='%Y-%m-%d')
-            start_dt = pd.to_datetime(camp["start_date"], format='%Y-%m-%d')
-            end_dt = pd.to_datetime(camp["end_date"], format='%Y-%m-%d')
+            date_dt = datetime.strptime(normalized_date, '%Y-%m-%d')
+            start_dt = datetime.strptime(camp["start_date"], '%Y-%m-%d')
+            end_dt = datetime.strptime(camp["end_date"], '%Y-%m-%d')
 
             # Check if date is within camp range (inclusive)
             if date_dt < start_dt or date_dt > end_dt:
@@ -1871,7 +2000,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Report", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
 
@@ -1944,7 +2073,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Report", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
         # Require selecting a report row
@@ -1956,9 +2085,8 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         # Get the report ID from the tree item ID
         report_id = int(report_sel[0])
         
-        # Fetch FULL report data from database, not from table display
-        reports = list_daily_reports(leader_id, assignment["camp_id"])
-        report = next((r for r in reports if r["id"] == report_id), None)
+        # Full report data was cached when the row was loaded
+        report = report_notes_by_id.get(report_id)
         if report is None:
             messagebox.showerror("Error", "Report not found.")
             return
@@ -2027,7 +2155,7 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
             messagebox.showinfo("Report", "Select an assignment from 'Camps' tab first.")
             return
         assignment_id = int(selection[0])
-        assignment = next((rec for rec in list_leader_assignments(leader_id) if rec["id"] == assignment_id), None)
+        assignment = assignments_by_id.get(assignment_id)
         if assignment is None:
             return
 
@@ -2111,27 +2239,30 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
         if not summary["per_camp"]:
             per_camp_text.insert(tk.END, "No camps assigned yet.\n")
         else:
-            for item in summary["per_camp"]:
-                per_camp_text.insert(
-                    tk.END,
-                    f"{item['camp_name']}: {item['days']} day(s) • £{item['pay']:.2f}\n",
-                )
+            per_camp_text.insert(
+                tk.END,
+                "".join(
+                    f"{item['camp_name']}: {item['days']} day(s) • £{item['pay']:.2f}\n"
+                    for item in summary["per_camp"]
+                ),
+            )
         per_camp_text.config(state="disabled")
 
-    # Initial load so the box is not empty
-    refresh_pay_summary()
-
-    # Also refresh whenever the Statistics tab becomes active
+    # Also refresh whenever the Statistics tab becomes active; the heavy
+    # statistics aggregation is deferred until the first visit and only
+    # re-run after a mutation invalidates it.
     def _on_tab_changed(event) -> None:
         try:
             current = event.widget.select()
             if event.widget.tab(current, "text") == "Statistics":
                 refresh_pay_summary()
+                if not stats_loaded:
+                    refresh_all_stats()
         except Exception:
             # Fail silently if notebook state is unexpected
             pass
 
-    notebook.bind("<<NotebookTabChanged>>", _on_tab_changed)
+    notebook.bind("<<NotebookTabChanged>>", _on_tab_changed, add="+")
 
     tk.Label(
         tab_stats,
@@ -2180,29 +2311,22 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
 
     def refresh_statistics() -> None:
         stats = get_leader_statistics(leader_id)
-        rows = []
-        for stat in stats:
-            rows.append(
-                (
-                    stat["camp_name"],
-                    stat["camp_area"],
-                    stat["camp_days"],
-                    stat["total_campers"],
-                    stat["campers_attending"],
-                    f"{stat['participation_rate']}%",
-                    stat["total_activities"],
-                    # Use the same effective daily figure shown in the coordinator dashboard
-                    stat.get("effective_daily_food", 0),
-                    stat["incident_report_count"],
-                )
+        rows = [
+            (
+                stat["camp_name"],
+                stat["camp_area"],
+                stat["camp_days"],
+                stat["total_campers"],
+                stat["campers_attending"],
+                f"{stat['participation_rate']}%",
+                stat["total_activities"],
+                # Use the same effective daily figure shown in the coordinator dashboard
+                stat.get("effective_daily_food", 0),
+                stat["incident_report_count"],
             )
-        stats_table.load_rows(rows)
-        # Zebra-striping after load
-        palette = get_palette(stats_table)
-        stats_table.tag_configure("even", background=palette["surface"])
-        stats_table.tag_configure("odd", background=tint(palette["surface"], -0.03))
-        for idx, item_id in enumerate(stats_table.get_children()):
-            stats_table.item(item_id, tags=("odd",) if (idx % 2 == 1) else ("even",))
+            for stat in stats
+        ]
+        stats_table.load_rows(rows, striped=True)
         # Empty state toggle
         if not rows:
             stats_empty_label.pack(pady=(0, 4), anchor=tk.W)
@@ -2222,36 +2346,67 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     summary_text.pack(fill=tk.X, pady=4)
 
     def update_summary() -> None:
-        stats = get_leader_statistics(leader_id)
+        # One SQL roll-up instead of re-fetching per-camp stats and
+        # summing them in Python
+        summary = get_leader_summary(leader_id)
         summary_text.config(state="normal")
         summary_text.delete("1.0", tk.END)
-        
-        if not stats:
+
+        if not summary["total_camps"]:
             summary_text.insert(tk.END, "No camps assigned yet.\n")
         else:
-            total_camps = len(stats)
-            total_campers = sum(s["total_campers"] for s in stats)
-            total_activities = sum(s["total_activities"] for s in stats)
-            total_food = sum(s["total_food_used"] for s in stats)
-            total_reports = sum(s["incident_report_count"] for s in stats)
-            avg_participation = sum(s["participation_rate"] for s in stats) / len(stats) if stats else 0
-            
-            summary_text.insert(tk.END, f"Total camps supervised: {total_camps}\n")
-            summary_text.insert(tk.END, f"Total campers across all camps: {total_campers}\n")
-            summary_text.insert(tk.END, f"Average participation rate: {avg_participation:.1f}%\n")
-            summary_text.insert(tk.END, f"Total activities conducted: {total_activities}\n")
-            summary_text.insert(tk.END, f"Total food resources used: {total_food} units\n")
-            summary_text.insert(tk.END, f"Incident/daily reports filed: {total_reports}\n")
-        
+            # One insert for the whole block instead of one Tcl call per line
+            summary_text.insert(
+                tk.END,
+                f"Total camps supervised: {summary['total_camps']}\n"
+                f"Total campers across all camps: {summary['total_campers']}\n"
+                f"Average participation rate: {summary['avg_participation']:.1f}%\n"
+                f"Total activities conducted: {summary['total_activities']}\n"
+                f"Total food resources used: {summary['total_food_used']} units\n"
+                f"Incident/daily reports filed: {summary['total_reports']}\n",
+            )
+
         summary_text.config(state="disabled")
 
+    stats_loaded = False
+
+    def _invalidate_stats() -> None:
+        # Called by mutation handlers so the next visit to the
+        # Statistics tab re-runs the aggregation.
+        nonlocal stats_loaded
+        stats_loaded = False
+
     def refresh_all_stats() -> None:
+        nonlocal stats_loaded
+        stats_loaded = True
+        # Leaders with no assignments get the empty state straight away
+        # instead of paying for the statistics aggregation query
+        if not assignments_table.get_children():
+            stats_table.load_rows([])
+            stats_empty_label.pack(pady=(0, 4), anchor=tk.W)
+            summary_text.config(state="normal")
+            summary_text.delete("1.0", tk.END)
+            summary_text.insert(tk.END, "No camps assigned yet.\n")
+            summary_text.config(state="disabled")
+            return
         refresh_statistics()
         update_summary()
 
-    refresh_all_stats()
+    stats_refresh_pending: Optional[str] = None
+
+    def _do_stats_refresh() -> None:
+        nonlocal stats_refresh_pending
+        stats_refresh_pending = None
+        refresh_all_stats()
+
+    def _schedule_stats_refresh() -> None:
+        # Coalesce rapid Refresh clicks into one recompute
+        nonlocal stats_refresh_pending
+        if stats_refresh_pending is not None:
+            tab_stats.after_cancel(stats_refresh_pending)
+        stats_refresh_pending = tab_stats.after(30, _do_stats_refresh)
 
-    tk.Button(stats_container, text="Refresh Statistics", command=refresh_all_stats).pack(pady=6)
+    tk.Button(stats_container, text="Refresh Statistics", command=_schedule_stats_refresh).pack(pady=6)
 
     # ========== Tab 6: Chat ==========
     tab_chat = tk.Frame(notebook)
@@ -2260,12 +2415,30 @@ def build_dashboard(root: tk.Misc, user: Dict[str, str], logout_callback: Callab
     tab_chat.grid_rowconfigure(0, weight=1)  # Message board expands
     tab_chat.grid_columnconfigure(0, weight=1)
 
-    MessageBoard(
-        tab_chat,
-        post_callback=lambda content: post_message(leader_id, content),
-        fetch_callback=lambda: list_messages_lines(),
-        current_user=user.get("username"),
-    ).grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+    def _build_chat_tab() -> None:
+        MessageBoard(
+            tab_chat,
+            post_callback=lambda content: post_message(leader_id, content),
+            fetch_callback=lambda: list_messages_lines(),
+            incremental_fetch=list_messages_lines_since,
+            current_user=user.get("username"),
+        ).grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+    # Deferred tab construction: the chat board queries the message
+    # table as soon as it is built, so creation waits for the first
+    # visit to the tab. Builders are popped so each runs once.
+    _tab_builders: Dict[str, Callable[[], None]] = {"Chat": _build_chat_tab}
+
+    def _on_tab_first_visit(event) -> None:
+        try:
+            current = event.widget.tab(event.widget.select(), "text")
+        except Exception:
+            return
+        builder = _tab_builders.pop(current, None)
+        if builder is not None:
+            builder()
+
+    notebook.bind("<<NotebookTabChanged>>", _on_tab_first_visit, add="+")
 
     return root_frame
 
@@ -19,6 +19,14 @@ ROLE_BUILDERS: Dict[str, RoleBuilder] = {
     "parent": parent.build_dashboard,
 }
 
+_ROLE_GEOMETRY: Dict[str, str] = {
+    "admin": "900x700",
+    "coordinator": "1200x800",
+    "leader": "1000x750",
+    "parent": "1000x750",
+}
+_DEFAULT_GEOMETRY = "1000x700"
+
 
 class CampTrackApp:
     def __init__(self) -> None:
@@ -26,12 +34,22 @@ class CampTrackApp:
         self.root.title("CampTrack - Login")
         self.root.geometry("420x280")
         self.root.resizable(True, True)
-        app_theme.apply_theme(self.root, mode="light")
+        self._init_styles()
 
         self.active_dashboard: Optional[tk.Widget] = None
 
         self._build_login_frame()
 
+    def _init_styles(self) -> None:
+        """Register every custom ttk style once at startup.
+
+        Style names ("Card.TFrame", "Muted.TLabel", "Filled.TCombobox",
+        ...) are resolved against this single registration, so dashboard
+        builds and logins never re-run the style configuration; widgets
+        that cache palette-derived colors listen for <<ThemeChanged>>.
+        """
+        app_theme.apply_theme(self.root, mode="light")
+
     def _build_login_frame(self) -> None:
         self.login_frame = ttk.Frame(self.root, padding=20)
         self.login_frame.pack(fill=tk.BOTH, expand=True)
@@ -94,13 +112,7 @@ class CampTrackApp:
         
         # Set appropriate window size for role (only if not fullscreen/zoomed)
         if not is_fullscreen and not is_zoomed:
-            role_sizes = {
-                "admin": "900x700",
-                "coordinator": "1200x800",
-                "leader": "1000x750",
-                "parent": "1000x750",
-            }
-            self.root.geometry(role_sizes.get(user["role"], "1000x700"))
+            self.root.geometry(_ROLE_GEOMETRY.get(user["role"], _DEFAULT_GEOMETRY))
         
         # Force window update to ensure geometry is applied before building dashboard
         self.root.update_idletasks()
@@ -1,3 +1,4 @@
+import functools
 import tkinter as tk
 from tkinter import ttk
 
@@ -170,8 +171,12 @@ def _configure_base_style(style: ttk.Style, palette: dict) -> None:
     )
 
 
+@functools.lru_cache(maxsize=256)
 def _tint(hex_color: str, delta: float) -> str:
-    """Lighten/darken a hex color by delta (-1..1)."""
+    """Lighten/darken a hex color by delta (-1..1).
+
+    The same handful of (color, delta) pairs recur across widgets, so
+    the result is memoized instead of re-parsing the hex each time."""
     hex_color = hex_color.lstrip("#")
     r = int(hex_color[0:2], 16)
     g = int(hex_color[2:4], 16)